@@ -5,28 +5,35 @@ import sys
 import re
 import ssl
 import time
+import random
+import io
 import json
 import shutil
 import tempfile
 import zipfile
+import sqlite3
 import threading
+import itertools
+import functools
 import concurrent.futures
 import pandas as pd
-from datetime import datetime
-from collections import deque
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from PySide6.QtWidgets import QApplication, QMainWindow, QFileDialog, QMessageBox
 from PySide6.QtCore import Slot, QObject, QUrl, Signal, QThread
 from PySide6.QtGui import QIcon
 from PySide6.QtWebEngineWidgets import QWebEngineView
+from PySide6.QtWebEngineCore import QWebEngineScript
 from PySide6.QtWebChannel import QWebChannel
 from PySide6 import QtCore
-from google.auth.transport.requests import Request
+from google.auth.transport.requests import AuthorizedSession, Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
 from googleapiclient.errors import HttpError
+import httplib2
+from requests.adapters import HTTPAdapter
 import stat
 
 # Import configuration
@@ -36,12 +43,176 @@ import logging
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Optional native spreadsheet parsers (fall back to pandas defaults)
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import python_calamine
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+# Compiled Qt resources (generated by build.py with pyside6-rcc); without
+# them the page is loaded from the HTML file on disk
+try:
+    import resources_rc
+    QRC_AVAILABLE = True
+except ImportError:
+    QRC_AVAILABLE = False
+
 # ===========================
 # CONFIG
 # ===========================
 SCOPES = ['https://www.googleapis.com/auth/drive.readonly']
 TOKEN_PATH = str(config.glink_token)
 CREDENTIALS_PATH = str(config.glink_credentials)
+METADATA_BATCH_SIZE = 100  # Drive API cap on calls per batch request
+REQUEST_INTERVAL = 0.1  # Seconds between request slots (10 req/s)
+DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files"
+MIN_CHUNK_MB = 8  # Smallest streaming read, fewer Python iterations per file
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+IN_MEMORY_MAX_BYTES = 8 * 1024 * 1024  # Files up to this size skip the temp file
+RETRY_BACKOFF_CAP = 60  # Upper bound in seconds for a single retry wait
+RETRY_AFTER_STATUSES = (403, 429, 500, 503)
+CACHE_LOOKUP_BATCH = 500  # Stay below SQLite's bound-parameter limit
+CACHE_MAX_BYTES = 2 * 1024 ** 3  # Least recently used copies past this are evicted
+CACHE_MAX_AGE = 30 * 24 * 3600  # Seconds an unused cached copy is kept
+CACHE_SCHEMA_VERSION = 2
+META_FIELDS = "name,mimeType,size,version"  # version changes on every edit, Docs included
+PROGRESS_INTERVAL = 0.05  # Minimum seconds between progress signals
+TOKEN_CHECK_INTERVAL = 60  # Seconds between proactive token expiry checks
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)  # Refresh when the token expires within this
+PROGRESS_FLUSH_MS = 33  # Page-side progress repaint cadence (~30 Hz)
+SOCKET_TIMEOUT = 30  # Seconds before a stalled connect/read raises, so cancel is never stuck
+
+# Drive/Docs file IDs, tried in this order like the original per-URL ladder:
+# a query parameter (open?id=..., uc?id=..., ...&id=...) wins over a /d/
+# path segment (/file/d/..., /u/N/file/d/..., /document/d/...,
+# /spreadsheets/d/..., /presentation/d/...)
+_FILE_ID_QUERY_RE = re.compile(r'[?&]id=([a-zA-Z0-9_-]{11,})(?![^&#])')
+_FILE_ID_PATH_RE = re.compile(r'/d/([a-zA-Z0-9_-]{11,})')
+
+# Filename sanitising, shared by the vectorized and scalar paths
+_INVALID_CHARS = r'[<>:"/\\|?*]'
+_CONTROL_CHARS = r'[\x00-\x1f\x7f-\x9f]'
+_CTRL_DEL = dict.fromkeys([*range(0x00, 0x20), *range(0x7f, 0xa0)])  # str.translate form
+MAX_NAME_LENGTH = 200
+
+# Drive payloads are mostly PDFs, images and office files that are already
+# compressed, so only these types are deflated when added to the ZIP
+_COMPRESSIBLE_MIMES = {'text/csv', 'text/plain', 'application/json', 'text/html'}
+
+# ===========================
+# HELPERS
+# ===========================
+def drive_file_id(url):
+    """Extract the Google Drive file ID from one link, or None"""
+    if not isinstance(url, str):
+        return None
+    url = url.strip()
+    m = _FILE_ID_QUERY_RE.search(url) or _FILE_ID_PATH_RE.search(url)
+    return m.group(1) if m else None
+
+
+def drive_file_ids(links):
+    """Vectorized drive_file_id over a Series; misses are NaN"""
+    links = links.astype(str)
+    return (links.str.extract(_FILE_ID_QUERY_RE, expand=False)
+                 .fillna(links.str.extract(_FILE_ID_PATH_RE, expand=False)))
+
+
+def move_file(src, dst):
+    """Move a file, renaming in place when src and dst share a filesystem"""
+    try:
+        os.replace(src, dst)
+    except OSError:
+        # Cross-device; shutil uses copy_file_range/sendfile on Linux
+        shutil.copy(src, dst)
+        os.remove(src)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_qwebchannel_js():
+    """Read qwebchannel.js from the Qt resources once per process"""
+    js_file = QtCore.QFile(":/qtwebchannel/qwebchannel.js")
+    if not js_file.open(QtCore.QIODevice.ReadOnly):
+        logger.error("Failed to load qwebchannel.js")
+        return None
+    
+    try:
+        return js_file.readAll().data().decode('utf-8')
+    finally:
+        js_file.close()
+
+
+@functools.lru_cache(maxsize=1)
+def _bridge_script():
+    """Bridge bootstrap run in the page; constant, so it is assembled once"""
+    qwebchannel_js = _load_qwebchannel_js()
+    if qwebchannel_js is None:
+        return None
+    
+    return qwebchannel_js + """
+        window.driveBridge = null;
+        window.bridgeReady = false;
+        
+        new QWebChannel(qt.webChannelTransport, function(channel) {
+            window.driveBridge = channel.objects.driveBridge;
+            window.bridgeReady = true;
+            console.log('[BRIDGE] Connected');
+            
+            // Payloads arrive as plain signal arguments, no script eval or escaping
+            window.driveBridge.fileLoaded.connect(function(data) { window.onFileLoaded(data); });
+            window.driveBridge.downloadComplete.connect(function(data) { window.onDownloadComplete(data); });
+            window.driveBridge.error.connect(function(message) { window.onError(message); });
+            
+            if (window.driveBridge.checkAuthentication) {
+                window.driveBridge.checkAuthentication();
+            }
+        });
+        """
+
+
+def http_error_info(error):
+    """Return (status, retry_after) for googleapiclient and requests HTTP errors"""
+    if isinstance(error, HttpError):
+        return error.resp.status, error.resp.get('retry-after')
+    response = getattr(error, 'response', None)
+    if response is not None:
+        return response.status_code, response.headers.get('Retry-After')
+    return None, None
+
+
+class _RawWriter(io.RawIOBase):
+    """Unbuffered sink that writes downloaded chunks straight to a fd
+    
+    Chunks are already several MiB, so a userspace buffer only adds a copy.
+    """
+    
+    def __init__(self, path):
+        super().__init__()
+        self._fd = os.open(path, _WRITE_FLAGS, 0o644)
+    
+    def writable(self):
+        return True
+    
+    def write(self, b):
+        view = memoryview(b)
+        total = len(view)
+        while view:
+            # os.write may return short counts; keep going until the chunk is out
+            view = view[os.write(self._fd, view):]
+        return total
+    
+    def close(self):
+        if not self.closed:
+            os.close(self._fd)
+        super().close()
+
 
 # ===========================
 # DOWNLOAD WORKER THREAD
@@ -54,98 +225,144 @@ class DownloadWorker(QThread):
     
     def __init__(self, df, selected_cols, credentials, settings):
         super().__init__()
-        self.df = df
         self.selected_cols = selected_cols
+        
+        # Materialize only what the pool threads read as plain per-row arrays,
+        # so downloads never index into the DataFrame
+        self._row_ids = df.index.tolist()
+        # Resolve all file IDs in one vectorized pass instead of per row in the workers
+        self._file_ids = drive_file_ids(df["Glink"]).to_numpy()
+        self._labels = self.build_labels(df, selected_cols)
+        
         self.credentials = credentials
         self.settings = settings
         
-        # Use config downloads directory
+        # Use config downloads directory (created on first access)
         downloads_dir = config.downloads_dir
-        downloads_dir.mkdir(exist_ok=True)
         self.temp_dir = tempfile.mkdtemp(dir=str(downloads_dir), prefix="glink_")
         
         self.is_cancelled = False
+        self._cancel_event = threading.Event()
         self.success_files = []
         self.failed_rows = []
+        self.meta_cache = {}
+        
+        # Output ZIP, filled by the pool threads as downloads finish
+        self.zip_path = os.path.join(self.temp_dir, "downloads.zip")
+        self._zip = None
+        self._zip_names = set()
+        self._zip_lock = threading.Lock()
+        
+        # Cache of previous downloads keyed by file_id, opened in run()
+        self._cache = None
+        self._cache_lock = threading.Lock()
         
         # Rate limiting
-        self.request_times = deque(maxlen=10)
+        self._next_slot = 0.0
         self.rate_limit_lock = threading.Lock()
         
+        # Shared credentials and one Drive service per pool thread
+        self._creds = Credentials(
+            token=credentials.token,
+            refresh_token=credentials.refresh_token,
+            token_uri=credentials.token_uri,
+            client_id=credentials.client_id,
+            client_secret=credentials.client_secret,
+            scopes=credentials.scopes,
+            expiry=credentials.expiry
+        )
+        self._creds_lock = threading.Lock()
+        self._refresh_timer = None
+        
+        # File content is streamed over one pooled keep-alive session shared by
+        # all pool threads; the per-thread services below only serve metadata
+        threads = settings['threads']
+        self._session = AuthorizedSession(self._creds)
+        self._session.mount('https://', HTTPAdapter(pool_connections=threads,
+                                                    pool_maxsize=threads * 2))
+        self._refresh_stop = threading.Event()
+        self._tls = threading.local()
+        
         logger.info(f"Worker temp directory: {self.temp_dir}")
         
     def extract_file_id(self, url):
         """Extract Google Drive file ID from URL"""
-        if pd.isna(url) or not isinstance(url, str):
-            return None
-        url = url.strip()
-        
-        patterns = [
-            r'id=([^&]+)',
-            r'/file/d/([a-zA-Z0-9-_]+)',
-            r'/open\?id=([a-zA-Z0-9-_]+)',
-            r'd/([a-zA-Z0-9-_]+)',
-            r'/document/d/([a-zA-Z0-9-_]+)',
-            r'/spreadsheets/d/([a-zA-Z0-9-_]+)',
-            r'/presentation/d/([a-zA-Z0-9-_]+)',
-            r'/u/\d+/file/d/([a-zA-Z0-9-_]+)',
-            r'file/d/([a-zA-Z0-9-_]+)/preview',
-            r'file/d/([a-zA-Z0-9-_]+)/view',
-        ]
-        
-        for pattern in patterns:
-            m = re.search(pattern, url)
-            if m:
-                file_id = m.group(1)
-                if len(file_id) > 10 and re.match(r'^[a-zA-Z0-9-_]+$', file_id):
-                    return file_id
-        
-        return None
+        return drive_file_id(url)
     
     def safe_filename(self, name):
-        """Remove invalid characters from filename"""
-        name = re.sub(r'[<>:"/\\|?*]', '_', str(name))
-        name = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', name)
-        if len(name) > 200:
-            name = name[:200]
-        return name
+        """Remove invalid characters from filename (scalar fallback)"""
+        name = re.sub(_INVALID_CHARS, '_', str(name)).translate(_CTRL_DEL)
+        return name[:MAX_NAME_LENGTH]
+    
+    def build_labels(self, df, columns):
+        """Build the sanitized '_'-joined file name label for every row
+        
+        Same result as applying safe_filename per cell and joining the non-missing
+        cells, but done with one vectorized pass per column.
+        """
+        labels = None
+        for c in columns:
+            col = df[c]
+            part = (col.astype(str).where(col.notna())
+                       .str.replace(_INVALID_CHARS, '_', regex=True)
+                       .str.replace(_CONTROL_CHARS, '', regex=True)
+                       .str.slice(0, MAX_NAME_LENGTH))
+            if labels is None:
+                labels = part
+            else:
+                # Missing cells are skipped rather than joined as empty parts
+                labels = (labels + "_" + part).fillna(labels).fillna(part)
+        
+        if labels is None:
+            return [""] * len(df)
+        return labels.fillna("").tolist()
     
     def rate_limit_wait(self):
         """Enforce rate limiting"""
         with self.rate_limit_lock:
-            now = time.time()
-            if len(self.request_times) >= 10:
-                oldest = self.request_times[0]
-                elapsed = now - oldest
-                if elapsed < 1.0:
-                    sleep_time = 1.0 - elapsed
-                    logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
-                    time.sleep(sleep_time)
-            self.request_times.append(time.time())
-    
-    def download_single_file(self, index, row):
+            now = time.monotonic()
+            wait = max(0.0, self._next_slot - now)
+            self._next_slot = max(now, self._next_slot) + REQUEST_INTERVAL
+        
+        # Sleep outside the lock so other threads can claim their slots meanwhile
+        if wait > 0:
+            logger.debug(f"Rate limiting: sleeping {wait:.2f}s")
+            time.sleep(wait)
+    
+    def retry_delay(self, error, attempt):
+        """Backoff before the next attempt, honouring Retry-After when present"""
+        status, retry_after = http_error_info(error)
+        if status in RETRY_AFTER_STATUSES:
+            if retry_after:
+                try:
+                    return min(RETRY_BACKOFF_CAP, float(retry_after))
+                except ValueError:
+                    pass  # HTTP-date form, fall back to backoff
+        
+        # Jitter keeps concurrent workers from retrying in lockstep
+        return min(RETRY_BACKOFF_CAP, (2 ** attempt) * random.uniform(0.5, 1.5))
+    
+    def download_single_file(self, pos):
         """Download a single file from Google Drive"""
+        index = self._row_ids[pos]
         if self.is_cancelled:
             return {"index": index, "error": "Cancelled"}
         
         self.rate_limit_wait()
         
         try:
-            creds = self._get_fresh_credentials()
-            drive_service = build('drive', 'v3', credentials=creds, cache_discovery=False)
-            
-            file_id = self.extract_file_id(row["Glink"])
-            if not file_id:
-                return {"index": index, "error": "Invalid link"}
-            
-            parts = [self.safe_filename(str(row[c])) for c in self.selected_cols if c in row and pd.notna(row[c])]
-            base_name = "_".join(parts) if parts else f"file_{index}"
+            file_id = self._file_ids[pos]
+            base_name = self._labels[pos] or f"file_{index}"
             
             try:
-                meta = drive_service.files().get(fileId=file_id, fields="name,mimeType,size").execute()
+                meta = self.meta_cache.get(file_id)
+                if meta is None:
+                    meta = self._service().files().get(fileId=file_id, fields=META_FIELDS).execute()
                 original_name = meta.get("name", "")
                 ext = os.path.splitext(original_name)[1] or ".file"
                 mime_type = meta.get("mimeType", "")
+                file_size = int(meta.get("size") or 0)
+                version = meta.get("version")
                 
                 if "google-apps" in mime_type:
                     ext = ".pdf"
@@ -158,61 +375,99 @@ class DownloadWorker(QThread):
                     return {"index": index, "error": "Access denied (403)"}
                 else:
                     ext = ".file"
+                    mime_type = ""
+                    file_size = 0
+                    version = None
                     logger.warning(f"Metadata error: {e}")
             
-            target_path = os.path.join(self.temp_dir, f"{base_name}{ext}")
+            entry_name = f"{base_name}{ext}"
             
-            counter = 1
-            while os.path.exists(target_path):
-                target_path = os.path.join(self.temp_dir, f"{base_name}_{counter}{ext}")
-                counter += 1
-            
-            chunk_size = self.settings['chunk'] * 1024 * 1024
+            chunk_size = max(self.settings['chunk'], MIN_CHUNK_MB) * 1024 * 1024
             retries = self.settings['retries']
             
+            # Small files of known size are buffered in memory and written to the
+            # ZIP directly, saving the temp file write, re-read and unlink
+            in_memory = 0 < file_size <= IN_MEMORY_MAX_BYTES
+            
+            target_path = None
+            if not in_memory:
+                # O_EXCL create gives a race-free unique name in one call
+                fd, target_path = tempfile.mkstemp(dir=self.temp_dir, prefix=f"{base_name}_", suffix=ext)
+                os.close(fd)
+            
             for attempt in range(1, retries + 1):
                 if self.is_cancelled:
                     return {"index": index, "error": "Cancelled"}
                 
                 try:
+                    # One streamed GET on the shared pooled session per file
                     if "google-apps" in mime_type:
-                        req = drive_service.files().export_media(fileId=file_id, mimeType='application/pdf')
+                        url = f"{DRIVE_FILES_URL}/{file_id}/export"
+                        params = {"mimeType": "application/pdf"}
                     else:
-                        req = drive_service.files().get_media(fileId=file_id)
+                        url = f"{DRIVE_FILES_URL}/{file_id}"
+                        params = {"alt": "media"}
                     
-                    with open(target_path, "wb") as fh:
-                        downloader = MediaIoBaseDownload(fh, req, chunksize=chunk_size)
-                        done = False
-                        while not done and not self.is_cancelled:
-                            status, done = downloader.next_chunk()
-                            if status and int(status.progress() * 100) % 25 == 0:
-                                logger.debug(f"{base_name}: {int(status.progress() * 100)}%")
+                    with self._session.get(url, params=params, stream=True,
+                                           timeout=SOCKET_TIMEOUT) as response:
+                        response.raise_for_status()
+                        
+                        if in_memory:
+                            fh = io.BytesIO()
+                        else:
+                            fh = _RawWriter(target_path)
+                        
+                        try:
+                            received = 0
+                            next_log = 0
+                            cancel_event = self._cancel_event
+                            for chunk in response.iter_content(chunk_size):
+                                if cancel_event.is_set():
+                                    break
+                                fh.write(chunk)
+                                received += len(chunk)
+                                if received >= next_log:
+                                    logger.debug(f"{base_name}: {received // 1024} KB")
+                                    next_log = received + 4 * chunk_size
+                            data = fh.getvalue() if in_memory else None
+                        finally:
+                            fh.close()
                     
                     if self.is_cancelled:
-                        if os.path.exists(target_path):
+                        if target_path and os.path.exists(target_path):
                             os.remove(target_path)
                         return {"index": index, "error": "Cancelled"}
                     
-                    if os.path.exists(target_path) and os.path.getsize(target_path) > 0:
-                        logger.info(f"Downloaded: {base_name}{ext}")
-                        return {"path": target_path, "name": os.path.basename(target_path)}
+                    if in_memory:
+                        downloaded = bool(data)
+                    else:
+                        downloaded = os.path.exists(target_path) and os.path.getsize(target_path) > 0
+                    
+                    if downloaded:
+                        name = self._add_to_zip(entry_name, mime_type, path=target_path, data=data)
+                        self._cache_download(file_id, mime_type, version, ext, target_path, data)
+                        logger.info(f"Downloaded: {name}")
+                        return {"path": target_path, "name": name}
                     else:
                         raise Exception("Downloaded file is empty")
                     
                 except (ssl.SSLError, HttpError, ConnectionError, OSError) as e:
                     if attempt < retries:
-                        wait_time = 2 ** attempt
-                        logger.warning(f"Retry {attempt}/{retries} for {base_name} in {wait_time}s")
-                        time.sleep(wait_time)
+                        wait_time = self.retry_delay(e, attempt)
+                        logger.warning(f"Retry {attempt}/{retries} for {base_name} in {wait_time:.1f}s")
+                        if self._cancel_event.wait(wait_time):
+                            return {"index": index, "error": "Cancelled"}
                     else:
                         error_msg = str(e)
-                        if isinstance(e, HttpError):
-                            if e.resp.status == 403:
-                                error_msg = "Access denied - quota exceeded"
-                            elif e.resp.status == 404:
-                                error_msg = "File not found"
-                            elif e.resp.status == 500:
-                                error_msg = "Google Drive server error"
+                        status, _ = http_error_info(e)
+                        if status == 403:
+                            error_msg = "Access denied - quota exceeded"
+                        elif status == 404:
+                            error_msg = "File not found"
+                        elif status == 429:
+                            error_msg = "Rate limit exceeded (429)"
+                        elif status == 500:
+                            error_msg = "Google Drive server error"
                         logger.error(f"{base_name} - {error_msg}")
                         return {"index": index, "error": error_msg}
                 
@@ -220,78 +475,363 @@ class DownloadWorker(QThread):
             logger.error(f"Downloading row {index}: {str(e)}", exc_info=True)
             return {"index": index, "error": str(e)}
     
-    def _get_fresh_credentials(self):
-        """Get credentials and refresh if expired"""
-        creds = Credentials(
-            token=self.credentials.token,
-            refresh_token=self.credentials.refresh_token,
-            token_uri=self.credentials.token_uri,
-            client_id=self.credentials.client_id,
-            client_secret=self.credentials.client_secret,
-            scopes=self.credentials.scopes
-        )
+    def _add_to_zip(self, name, mime_type="", path=None, data=None):
+        """Add a finished download to the output ZIP under a unique entry name
+        
+        The content comes from data when the file was buffered in memory,
+        otherwise from the file at path.
+        """
+        stem, ext = os.path.splitext(name)
+        
+        if mime_type in _COMPRESSIBLE_MIMES:
+            compress_type, compresslevel = zipfile.ZIP_DEFLATED, 1
+        else:
+            compress_type, compresslevel = zipfile.ZIP_STORED, None
+        
+        with self._zip_lock:
+            counter = 1
+            while name in self._zip_names:
+                name = f"{stem}_{counter}{ext}"
+                counter += 1
+            self._zip_names.add(name)
+            if data is not None:
+                self._zip.writestr(name, data, compress_type=compress_type,
+                                   compresslevel=compresslevel)
+            else:
+                self._zip.write(path, arcname=name, compress_type=compress_type,
+                                compresslevel=compresslevel)
+        
+        return name
+    
+    def _open_cache(self):
+        """Open the download cache index, leaving caching disabled on failure
+        
+        Caching is opt-in: every cached download is kept as a second full copy
+        next to the ZIP, and buffered downloads have to be written out to disk.
+        """
+        if not self.settings.get('cache'):
+            return
+        
+        try:
+            config.glink_cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(config.glink_cache_db), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] < CACHE_SCHEMA_VERSION:
+                # Older indexes pointed into the temp dir or carry no version
+                conn.execute("DROP TABLE IF EXISTS files")
+                conn.execute(f"PRAGMA user_version={CACHE_SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS files("
+                "file_id TEXT PRIMARY KEY, mime_type TEXT, version TEXT, size INTEGER, path TEXT, "
+                "used_at REAL)"
+            )
+            conn.commit()
+            self._cache = conn
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Download cache disabled: {e}")
+            self._cache = None
+    
+    def _cached_files(self, file_ids):
+        """Return {file_id: (path, mime_type)} for cached files still current
+        
+        A copy counts only while its size on disk matches and its Drive
+        version matches the prefetched metadata; anything else is
+        downloaded again and replaces the row.
+        """
+        if self._cache is None or not file_ids:
+            return {}
+        
+        rows = []
+        with self._cache_lock:
+            for start in range(0, len(file_ids), CACHE_LOOKUP_BATCH):
+                chunk = file_ids[start:start + CACHE_LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(chunk))
+                rows += self._cache.execute(
+                    f"SELECT file_id, mime_type, version, size, path FROM files WHERE file_id IN ({placeholders})",
+                    chunk
+                ).fetchall()
         
-        if creds.expired and creds.refresh_token:
+        hits = {}
+        for file_id, mime_type, version, size, path in rows:
+            meta = self.meta_cache.get(file_id)
+            if meta is None or meta.get("version") != version:
+                continue  # Changed on Drive, or unknown without metadata
             try:
-                creds.refresh(Request())
-                logger.info("Refreshed token")
-            except Exception as e:
-                logger.error(f"Token refresh failed: {e}")
+                if os.path.getsize(path) == size:
+                    hits[file_id] = (path, mime_type)
+            except OSError:
+                pass  # Cached copy was removed, download again
+        
+        if hits:
+            # Reused copies count as fresh for eviction
+            now = time.time()
+            with self._cache_lock:
+                self._cache.executemany("UPDATE files SET used_at = ? WHERE file_id = ?",
+                                        [(now, file_id) for file_id in hits])
+                self._cache.commit()
+        return hits
+    
+    def _cache_download(self, file_id, mime_type, version, ext, path, data=None):
+        """Keep a finished download so later runs on the same sheet can skip it
+        
+        The temp file at path is moved into the cache (or removed when caching
+        is unavailable). Buffered downloads are written out from data. Files
+        whose Drive version is unknown are not cached, since a later run
+        could not tell whether they changed.
+        """
+        if self._cache is None or version is None:
+            if data is None:
+                os.remove(path)
+            return
+        
+        cache_path = config.glink_cache_dir / f"{file_id}{ext}"
+        try:
+            if data is not None:
+                cache_path.write_bytes(data)
+            else:
+                shutil.move(path, cache_path)
+            
+            with self._cache_lock:
+                self._cache.execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                    (file_id, mime_type, version, os.path.getsize(cache_path), str(cache_path),
+                     time.time())
+                )
+                self._cache.commit()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not cache {file_id}: {e}")
+            if data is None and os.path.exists(path):
+                os.remove(path)
+    
+    def _evict_cache(self):
+        """Drop cached copies unused for CACHE_MAX_AGE or past CACHE_MAX_BYTES
+        
+        Newest copies are kept first, so the files of the run that just
+        finished survive unless they alone exceed the limit.
+        """
+        cutoff = time.time() - CACHE_MAX_AGE
+        with self._cache_lock:
+            rows = self._cache.execute(
+                "SELECT file_id, size, path, used_at FROM files ORDER BY used_at DESC"
+            ).fetchall()
+            
+            kept = 0
+            stale = []
+            for file_id, size, path, used_at in rows:
+                kept += size
+                if used_at < cutoff or kept > CACHE_MAX_BYTES:
+                    stale.append((file_id, path))
+            if not stale:
+                return
+            
+            for _, path in stale:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass  # Already gone
+            self._cache.executemany("DELETE FROM files WHERE file_id = ?",
+                                    [(file_id,) for file_id, _ in stale])
+            self._cache.commit()
+        logger.info(f"Evicted {len(stale)} files from the download cache")
+    
+    def add_cached_files(self, positions, successes):
+        """Add rows already in the download cache to the ZIP
+        
+        Each reused file is appended to successes as (path, name). Returns the positions that still need downloading.
+        """
+        file_ids = list(dict.fromkeys(self._file_ids[pos] for pos in positions))
+        hits = self._cached_files(file_ids)
+        if not hits:
+            return positions
+        
+        remaining = []
+        for pos in positions:
+            hit = hits.get(self._file_ids[pos])
+            if hit is None:
+                remaining.append(pos)
+                continue
+            
+            path, mime_type = hit
+            base_name = self._labels[pos] or f"file_{self._row_ids[pos]}"
+            name = self._add_to_zip(f"{base_name}{os.path.splitext(path)[1]}", mime_type, path=path)
+            successes.append((path, name))
         
-        return creds
+        logger.info(f"Reused {len(positions) - len(remaining)} files from the download cache")
+        return remaining
+    
+    def _maybe_refresh(self):
+        """Refresh the shared token when it is expired or about to expire"""
+        with self._creds_lock:
+            creds = self._creds
+            if not creds.refresh_token or creds.expiry is None:
+                return  # Unknown expiry; AuthorizedHttp still refreshes on a 401
+            
+            # Credentials.expiry is naive UTC
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            if creds.expiry - now < TOKEN_REFRESH_MARGIN:
+                try:
+                    creds.refresh(Request())
+                    logger.info("Refreshed token")
+                except Exception as e:
+                    logger.error(f"Token refresh failed: {e}")
+    
+    def _schedule_refresh(self):
+        """Check the token every TOKEN_CHECK_INTERVAL seconds until the run ends"""
+        if self._refresh_stop.is_set():
+            return
+        
+        def tick():
+            self._maybe_refresh()
+            self._schedule_refresh()
+        
+        self._refresh_timer = threading.Timer(TOKEN_CHECK_INTERVAL, tick)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+    
+    def _service(self):
+        """Get the Drive service for the current thread, building it on first use"""
+        svc = getattr(self._tls, 'svc', None)
+        if svc is None:
+            # httplib2.Http is not thread-safe, so each pool thread keeps its own
+            # service (and its open connections) for the whole batch. The socket
+            # timeout bounds how long a stalled handshake can delay a cancel.
+            http = AuthorizedHttp(self._creds,
+                                  http=httplib2.Http(timeout=SOCKET_TIMEOUT))
+            svc = build('drive', 'v3', http=http,
+                        cache_discovery=False, static_discovery=True)
+            self._tls.svc = svc
+        return svc
+    
+    def prefetch_metadata(self, positions):
+        """Fetch metadata for the given rows using batched Drive requests"""
+        file_ids = list(dict.fromkeys(self._file_ids[pos] for pos in positions))
+        
+        if not file_ids:
+            return
+        
+        drive_service = self._service()
+        
+        def on_response(request_id, response, exception):
+            if exception is None:
+                self.meta_cache[request_id] = response
+            else:
+                # Leave cache miss; download_single_file retries with a single GET
+                logger.debug(f"Batch metadata failed for {request_id}: {exception}")
+        
+        for start in range(0, len(file_ids), METADATA_BATCH_SIZE):
+            if self.is_cancelled:
+                return
+            
+            batch = drive_service.new_batch_http_request(callback=on_response)
+            for file_id in file_ids[start:start + METADATA_BATCH_SIZE]:
+                batch.add(
+                    drive_service.files().get(fileId=file_id, fields=META_FIELDS),
+                    request_id=file_id
+                )
+            
+            self.rate_limit_wait()
+            try:
+                batch.execute()
+            except (ssl.SSLError, HttpError, ConnectionError, OSError) as e:
+                logger.warning(f"Metadata batch failed, falling back to per-file lookups: {e}")
+        
+        logger.info(f"Prefetched metadata for {len(self.meta_cache)}/{len(file_ids)} files")
     
     def run(self):
         """Main worker thread execution"""
         try:
-            total = len(self.df)
-            completed = 0
+            total = len(self._row_ids)
+            successes = []
+            failures = []
+            
+            # Rows without a recognisable Drive link never reach the thread pool
+            valid = pd.notna(self._file_ids)
+            for pos in range(total):
+                if not valid[pos]:
+                    failures.append({"index": self._row_ids[pos], "error": "Invalid link"})
+            completed = len(failures)
+            if completed:
+                logger.warning(f"Skipping {completed} rows with invalid links")
+                self.progress_update.emit(completed, total)
+            
+            self._open_cache()
             
-            logger.info(f"Downloading {total} files with {self.settings['threads']} threads")
+            # Refresh up front and then on a timer, so pool threads never race on it
+            self._maybe_refresh()
+            self._schedule_refresh()
             
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.settings['threads']) as executor:
-                futures = [executor.submit(self.download_single_file, i, row) 
-                          for i, row in self.df.iterrows()]
+            threads = self.settings['threads']
+            
+            with zipfile.ZipFile(self.zip_path, "w", zipfile.ZIP_STORED, allowZip64=True) as zipf:
+                self._zip = zipf
                 
-                for fut in concurrent.futures.as_completed(futures):
-                    if self.is_cancelled:
-                        logger.info("Download cancelled by user")
-                        for f in futures:
-                            f.cancel()
-                        executor.shutdown(wait=False, cancel_futures=True)
-                        break
-                    
-                    try:
-                        res = fut.result(timeout=5)
-                    except concurrent.futures.TimeoutError:
-                        res = {"index": -1, "error": "Timeout"}
-                    except Exception as e:
-                        res = {"index": -1, "error": str(e)}
-                    
-                    completed += 1
+                # Cached rows need metadata too, to check their Drive version
+                pending = [pos for pos in range(total) if valid[pos]]
+                self.prefetch_metadata(pending)
+                
+                pending = self.add_cached_files(pending, successes)
+                completed = total - len(pending)
+                if successes:
                     self.progress_update.emit(completed, total)
+                
+                logger.info(f"Downloading {len(pending)} files with {threads} threads")
+                last_emit = 0.0
+                
+                positions = iter(pending)
+                
+                with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+                    # Keep a bounded window of rows in flight instead of queueing a
+                    # future for every row of the sheet up front
+                    futures = {executor.submit(self.download_single_file, pos)
+                               for pos in itertools.islice(positions, threads * 2)}
                     
-                    if res.get("path"):
-                        self.success_files.append((res["path"], res["name"]))
-                    else:
-                        self.failed_rows.append({
-                            "index": res.get("index", -1), 
-                            "error": res.get("error", "Unknown")
-                        })
+                    while futures:
+                        done, futures = concurrent.futures.wait(
+                            futures, return_when=concurrent.futures.FIRST_COMPLETED)
+                        
+                        if self._cancel_event.is_set():
+                            logger.info("Download cancelled by user")
+                            # Drops queued rows; running ones see the event and return
+                            executor.shutdown(wait=False, cancel_futures=True)
+                            break
+                        
+                        for fut in done:
+                            try:
+                                res = fut.result()
+                            except Exception as e:
+                                res = {"index": -1, "error": str(e)}
+                            
+                            completed += 1
+                            # Each emit crosses into the GUI thread and the page, so
+                            # cap updates at ~20/s and always send the last one
+                            now = time.monotonic()
+                            if completed == total or now - last_emit > PROGRESS_INTERVAL:
+                                self.progress_update.emit(completed, total)
+                                last_emit = now
+                            
+                            if res.get("path"):
+                                successes.append((res["path"], res["name"]))
+                            else:
+                                failures.append({
+                                    "index": res.get("index", -1), 
+                                    "error": res.get("error", "Unknown")
+                                })
+                            
+                            next_pos = next(positions, None)
+                            if next_pos is not None:
+                                futures.add(executor.submit(self.download_single_file, next_pos))
+            
+            self.success_files = successes
+            self.failed_rows = failures
             
             if self.success_files and not self.is_cancelled:
-                logger.info(f"Creating ZIP with {len(self.success_files)} files")
-                zip_path = os.path.join(self.temp_dir, "downloads.zip")
-                
-                with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-                    for path, name in self.success_files:
-                        if os.path.exists(path):
-                            zipf.write(path, arcname=name)
+                logger.info(f"ZIP ready with {len(self.success_files)} files")
                 
                 results = {
                     "successful": len(self.success_files),
                     "failed": len(self.failed_rows),
                     "errors": self.failed_rows,
-                    "zipPath": zip_path
+                    "zipPath": self.zip_path
                 }
                 
                 logger.info(f"Download complete: {results['successful']} successful, {results['failed']} failed")
@@ -306,12 +846,23 @@ class DownloadWorker(QThread):
             logger.error(f"Worker error: {str(e)}", exc_info=True)
             self.error.emit(f"Download failed: {str(e)}")
         finally:
+            self._refresh_stop.set()
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+            if self._cache is not None:
+                try:
+                    self._evict_cache()
+                except (sqlite3.Error, OSError) as e:
+                    logger.warning(f"Download cache eviction failed: {e}")
+                self._cache.close()
+            self._session.close()
             time.sleep(1)
             self.cleanup()
     
     def cancel(self):
         """Cancel download"""
         self.is_cancelled = True
+        self._cancel_event.set()
         logger.info("Stopping downloads")
         self.requestInterruption()
     
@@ -487,7 +1038,13 @@ class DriveDownloaderBridge(QObject):
                 logger.info(f"Loading file: {file_path}")
                 
                 if file_path.endswith('.csv'):
-                    self.df = pd.read_csv(file_path, encoding='utf-8')
+                    if PYARROW_AVAILABLE:
+                        self.df = pd.read_csv(file_path, encoding='utf-8', engine='pyarrow',
+                                              dtype_backend='pyarrow')
+                    else:
+                        self.df = pd.read_csv(file_path, encoding='utf-8')
+                elif CALAMINE_AVAILABLE:
+                    self.df = pd.read_excel(file_path, engine='calamine')
                 else:
                     self.df = pd.read_excel(file_path)
                 
@@ -499,7 +1056,7 @@ class DriveDownloaderBridge(QObject):
                     return
                 
                 original_count = len(self.df)
-                self.df = self.df.dropna(subset=['Glink'])
+                self.df = self.df[self.df['Glink'].notna()]
                 removed_count = original_count - len(self.df)
                 
                 if removed_count > 0:
@@ -561,8 +1118,9 @@ class DriveDownloaderBridge(QObject):
                     self.worker.terminate()
                     self.worker.wait()
             
+            # Project to the columns the worker reads instead of copying the whole sheet
             self.worker = DownloadWorker(
-                self.df.copy(),
+                self.df[['Glink', *selected_cols]],
                 selected_cols,
                 self.credentials,
                 settings
@@ -605,7 +1163,8 @@ class DriveDownloaderBridge(QObject):
                 save_path = config.downloads_dir / default_name
                 
                 try:
-                    shutil.copy(self.zip_path, save_path)
+                    move_file(self.zip_path, save_path)
+                    self.zip_path = str(save_path)
                     
                     if sys.platform != 'win32':
                         os.chmod(save_path, 0o644)
@@ -659,7 +1218,8 @@ class DriveDownloaderBridge(QObject):
         
         if save_path:
             try:
-                shutil.copy(self.zip_path, save_path)
+                move_file(self.zip_path, save_path)
+                self.zip_path = save_path
                 QMessageBox.information(None, "Success", f"ZIP saved to:\n{save_path}")
             except Exception as e:
                 QMessageBox.critical(None, "Error", f"Failed to save: {str(e)}")
@@ -677,7 +1237,14 @@ class DriveDownloaderBridge(QObject):
 class DriveDownloaderWindow(QMainWindow):
     """Main window for Drive Downloader"""
     
-    def __init__(self, html_content):
+    # Bridge signals forwarded to page handlers via runJavaScript
+    SIGNAL_MAP = {
+        'authSuccess': 'onAuthSuccess',
+        'authPending': 'onAuthPending',
+        'authError': 'onAuthError',
+    }
+    
+    def __init__(self, html_url):
         super().__init__()
         self.setWindowTitle("NBA GLink Extractor")
         self.setMinimumSize(1200, 800)
@@ -697,15 +1264,24 @@ class DriveDownloaderWindow(QMainWindow):
         self.channel.registerObject("driveBridge", self.bridge)
         self.view.page().setWebChannel(self.channel)
         
-        self.bridge.authSuccess.connect(lambda: self.call_js("window.onAuthSuccess()"))
-        self.bridge.authPending.connect(lambda: self.call_js("window.onAuthPending()"))
-        self.bridge.authError.connect(lambda: self.call_js("window.onAuthError()"))
-        self.bridge.fileLoaded.connect(self.on_file_loaded)
-        self.bridge.progressUpdate.connect(lambda c, t: self.call_js(f"window.onProgressUpdate({c}, {t})"))
-        self.bridge.downloadComplete.connect(self.on_download_complete_js)
-        self.bridge.error.connect(self.on_error_js)
+        # Progress ticks are coalesced so only the latest value reaches the page
+        self._pending_progress = None
+        self._progress_timer = QtCore.QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_FLUSH_MS)
+        self._progress_timer.timeout.connect(self.flush_progress)
+        
+        for sig_name, js_fn in self.SIGNAL_MAP.items():
+            getattr(self.bridge, sig_name).connect(functools.partial(self._forward, js_fn))
+        self.bridge.progressUpdate.connect(self.on_progress_update)
+        
+        # fileLoaded / downloadComplete / error payloads reach the page as
+        # WebChannel signals (see load_html_with_bridge); only make sure the
+        # final progress value is sent ahead of them
+        self.bridge.downloadComplete.connect(self.flush_progress)
+        self.bridge.error.connect(self.flush_progress)
         
-        self.load_html_with_bridge(html_content)
+        self.load_html_with_bridge(html_url)
         logger.info("Window initialized")
     
     def center_on_screen(self):
@@ -722,65 +1298,50 @@ class DriveDownloaderWindow(QMainWindow):
         """Execute JavaScript"""
         self.view.page().runJavaScript(script)
     
-    def escape_js_string(self, s):
-        """Escape string for JavaScript"""
-        return (s.replace('\\', '\\\\')
-                 .replace("'", "\\'")
-                 .replace('"', '\\"')
-                 .replace('\n', '\\n')
-                 .replace('\r', '\\r')
-                 .replace('\t', '\\t'))
-    
-    def on_file_loaded(self, data):
-        """Handle file loaded"""
-        escaped = self.escape_js_string(data)
-        self.call_js(f"window.onFileLoaded('{escaped}')")
-    
-    def on_download_complete_js(self, data):
-        """Handle download complete"""
-        escaped = self.escape_js_string(data)
-        self.call_js(f"window.onDownloadComplete('{escaped}')")
-    
-    def on_error_js(self, msg):
-        """Handle error"""
-        escaped = self.escape_js_string(msg)
-        self.call_js(f"window.onError('{escaped}')")
-    
-    def load_html_with_bridge(self, html_content):
+    def _forward(self, js_fn, *args):
+        """Call window.<js_fn>(...) in the page with JSON-encoded arguments"""
+        self.call_js(f"window.{js_fn}({', '.join(map(json.dumps, args))})")
+    
+    def on_progress_update(self, completed, total):
+        """Queue a progress update for the next flush"""
+        self._pending_progress = (completed, total)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+    
+    def flush_progress(self, *_):
+        """Send the latest queued progress to the page"""
+        if self._pending_progress is None:
+            return
+        completed, total = self._pending_progress
+        self._pending_progress = None
+        self._forward("onProgressUpdate", completed, total)
+    
+    def load_html_with_bridge(self, html_url):
         """Load HTML with bridge"""
-        js_file = QtCore.QFile(":/qtwebchannel/qwebchannel.js")
-        if not js_file.open(QtCore.QIODevice.ReadOnly):
-            logger.error("Failed to load qwebchannel.js")
+        bridge_script = _bridge_script()
+        if bridge_script is None:
             return
         
-        qwebchannel_js = js_file.readAll().data().decode('utf-8')
-        js_file.close()
-        
-        bridge_script = f"""
-        <script>
-        {qwebchannel_js}
-        </script>
-        <script>
-        window.driveBridge = null;
-        window.bridgeReady = false;
-        
-        new QWebChannel(qt.webChannelTransport, function(channel) {{
-            window.driveBridge = channel.objects.driveBridge;
-            window.bridgeReady = true;
-            console.log('[BRIDGE] Connected');
-            
-            if (window.driveBridge.checkAuthentication) {{
-                window.driveBridge.checkAuthentication();
-            }}
-        }});
-        </script>
-        """
-        
-        if "</head>" in html_content:
-            html_content = html_content.replace("</head>", f"{bridge_script}</head>")
+        # Registered on the page so the engine injects it into every load;
+        # DocumentReady runs after the page's own script has defined the
+        # window.onX handlers the bridge calls into
+        script = QWebEngineScript()
+        script.setName("driveBridge")
+        script.setSourceCode(bridge_script)
+        script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentReady)
+        script.setWorldId(QWebEngineScript.ScriptWorldId.MainWorld)
+        script.setRunsOnSubFrames(False)
+        self.view.page().scripts().insert(script)
         
-        self.view.setHtml(html_content, QUrl("file:///"))
-        logger.info("HTML loaded")
+        self.view.loadFinished.connect(self.on_load_finished)
+        self.view.load(html_url)
+    
+    def on_load_finished(self, ok):
+        """Log the page load result"""
+        if ok:
+            logger.info("HTML loaded")
+        else:
+            logger.error("Failed to load HTML")
     
     def closeEvent(self, event):
         """Handle window close"""
@@ -835,7 +1396,13 @@ def main():
     # Use config HTML path
     html_path = config.glink_html
     
-    if not os.path.exists(html_path):
+    if QRC_AVAILABLE:
+        # Served straight from the memory-mapped resource data in the binary
+        html_url = QUrl("qrc:/nba-drive-downloader.html")
+    else:
+        html_url = QUrl.fromLocalFile(str(html_path))
+    
+    if not QRC_AVAILABLE and not os.path.exists(html_path):
         QMessageBox.critical(
             None,
             "Missing File",
@@ -844,10 +1411,11 @@ def main():
         )
         sys.exit(1)
     
-    with open(html_path, "r", encoding="utf-8") as f:
-        html_content = f.read()
+    window = DriveDownloaderWindow(html_url)
     
-    window = DriveDownloaderWindow(html_content)
+    # Pre-spawned by the launcher: imports and window are ready, wait for the click
+    if not config.wait_if_prewarmed():
+        sys.exit(0)
     window.show()
     
     logger.info("GLink Extractor started successfully")
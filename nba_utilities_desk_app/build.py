@@ -6,9 +6,31 @@ import os
 import sys
 import subprocess
 import shutil
+import importlib.util
 from pathlib import Path
 
 
+def _link_or_copy(src, dst):
+    """Hardlink src to dst, copying only when the filesystem can't link"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+def _replicate(src, dst):
+    """Replicate a file or directory tree using hardlinks where possible
+    
+    The GLink and PDFMerger folders share the same Qt/PySide6 binaries, so
+    linking them avoids writing hundreds of MB of duplicate data.
+    """
+    if src.is_dir():  # Path or os.DirEntry (cached type, no stat)
+        shutil.copytree(src, dst, copy_function=_link_or_copy)
+    else:
+        _link_or_copy(src, dst)
+
+
 class Builder:
     """Automated builder for NBA Utilities"""
     
@@ -36,23 +58,29 @@ class Builder:
         # Map: pip package name -> import name
         required = {
             'PySide6': 'PySide6',
+            'qasync': 'qasync',
             'google-auth': 'google.auth',
             'google-auth-oauthlib': 'google_auth_oauthlib',
             'google-auth-httplib2': 'google_auth_httplib2',
             'google-api-python-client': 'googleapiclient',
             'pandas': 'pandas',
             'pikepdf': 'pikepdf',
-            'appdirs': 'appdirs',
             'pyinstaller': 'PyInstaller',  # PyInstaller module name
         }
         
+        # find_spec only locates each package, so heavy modules such as
+        # PySide6 and pandas are not actually imported just to check them
         missing = []
         for pkg, import_name in required.items():
             try:
-                __import__(import_name)
+                found = importlib.util.find_spec(import_name) is not None
+            except (ImportError, ValueError):
+                found = False
+            
+            if found:
                 print(f"  ✓ {pkg}")
-            except ImportError as e:
-                print(f"  ✗ {pkg} - MISSING ({e})")
+            else:
+                print(f"  ✗ {pkg} - MISSING")
                 missing.append(pkg)
         
         if missing:
@@ -75,6 +103,7 @@ class Builder:
             'nba-drive-downloader.html',
             'nba-pdf-merger.html',
             'icon.ico',
+            'resources.qrc',
         ]
         
         missing = []
@@ -92,6 +121,24 @@ class Builder:
         
         print("[VERIFY] All files found!")
     
+    def compile_resources(self):
+        """Compile resources.qrc so the apps serve their pages from the Qt resource system"""
+        print("\n[RCC] Compiling Qt resources...")
+        
+        rcc = shutil.which('pyside6-rcc')
+        if rcc is None:
+            # The apps fall back to the HTML files bundled on disk
+            print("  ✗ pyside6-rcc not found - skipping, HTML will load from disk")
+            return
+        
+        cmd = [rcc, str(self.root_dir / "resources.qrc"), '-o', str(self.root_dir / "resources_rc.py")]
+        print(f"  Running: {' '.join(cmd)}")
+        if subprocess.call(cmd) != 0:
+            print("[ERROR] Resource compilation failed!")
+            sys.exit(1)
+        
+        print("[RCC] Complete!")
+    
     def build_with_pyinstaller(self):
         """Build using PyInstaller"""
         print("\n[BUILD] Building with PyInstaller...")
@@ -111,11 +158,16 @@ class Builder:
         ]
         
         print(f"  Running: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # Stream PyInstaller's log as it runs instead of buffering all of it
+        proc = subprocess.Popen(cmd, stdout=sys.stdout, stderr=subprocess.PIPE,
+                                text=True, bufsize=1)
+        for line in proc.stderr:
+            sys.stderr.write(line)
+        returncode = proc.wait()
         
-        if result.returncode != 0:
+        if returncode != 0:
+            # The log, including the error, is already on the console
             print("[ERROR] PyInstaller build failed!")
-            print(result.stderr)
             sys.exit(1)
         
         print("[BUILD] PyInstaller build complete!")
@@ -143,47 +195,51 @@ class Builder:
             sys.exit(1)
         
         print("  Copying main application files...")
-        for item in dist_contents.iterdir():
-            if item.name == 'NBA_GLink_Extractor.exe':
-                # Move GLink to subdirectory
-                print(f"    → {item.name} to GLink/")
-                shutil.copy2(item, glink_dir / item.name)
-                # Copy dependencies
-                for dep in dist_contents.iterdir():
-                    if dep.suffix in ['.dll', '.pyd'] or dep.is_dir():
-                        if dep.name not in ['GLink', 'PDFMerger']:
-                            dest = glink_dir / dep.name
-                            if not dest.exists():
-                                if dep.is_dir():
-                                    shutil.copytree(dep, dest)
-                                else:
-                                    shutil.copy2(dep, dest)
-            
-            elif item.name == 'NBA_PDF_Merger.exe':
-                # Move Merger to subdirectory
-                print(f"    → {item.name} to PDFMerger/")
-                shutil.copy2(item, merger_dir / item.name)
-                # Copy dependencies
-                for dep in dist_contents.iterdir():
-                    if dep.suffix in ['.dll', '.pyd'] or dep.is_dir():
-                        if dep.name not in ['GLink', 'PDFMerger']:
-                            dest = merger_dir / dep.name
-                            if not dest.exists():
-                                if dep.is_dir():
-                                    shutil.copytree(dep, dest)
-                                else:
-                                    shutil.copy2(dep, dest)
-            
+        
+        # List the dist tree once and split it into tool exes, shared
+        # dependencies and everything else in a single pass
+        tool_dirs = {
+            'NBA_GLink_Extractor.exe': glink_dir,
+            'NBA_PDF_Merger.exe': merger_dir,
+        }
+        # scandir entries carry the file type from the directory read itself,
+        # so is_dir() below costs no extra stat per entry
+        with os.scandir(dist_contents) as it:
+            entries = list(it)
+        
+        exes = []
+        deps = []
+        for item in entries:
+            is_dir = item.is_dir(follow_symlinks=False)
+            suffix = os.path.splitext(item.name)[1]
+            if item.name in tool_dirs:
+                exes.append(item)
             else:
+                if (is_dir or suffix in ('.dll', '.pyd')) and item.name not in ('GLink', 'PDFMerger'):
+                    deps.append(item)
+                
                 # Copy to main directory
                 dest = main_dir / item.name
-                if item.is_dir():
+                if is_dir:
                     if not dest.exists():
                         print(f"    → {item.name}/ (directory)")
-                        shutil.copytree(item, dest)
+                        _replicate(item, dest)
                 else:
                     print(f"    → {item.name}")
-                    shutil.copy2(item, dest)
+                    if suffix == '.exe':
+                        shutil.copy2(item, dest)  # Executables keep their own inode
+                    else:
+                        _replicate(item, dest)
+        
+        for exe in exes:
+            # Move the tool into its subdirectory alongside its dependencies
+            tool_dir = tool_dirs[exe.name]
+            print(f"    → {exe.name} to {tool_dir.name}/")
+            shutil.copy2(exe, tool_dir / exe.name)
+            for dep in deps:
+                dest = tool_dir / dep.name
+                if not dest.exists():
+                    _replicate(dep, dest)
         
         print("[ORGANIZE] Structure created!")
     
@@ -287,6 +343,7 @@ This software is provided for internal use only.
             self.clean()
             self.check_dependencies()
             self.verify_files()
+            self.compile_resources()
             self.build_with_pyinstaller()
             self.organize_output()
             self.create_readme()
@@ -25,8 +25,8 @@ a_main = Analysis(
         'PySide6.QtGui',
         'PySide6.QtWidgets',
         'PySide6.QtWebEngineWidgets',
-        'PySide6.QtWebChannel',
-        'appdirs',
+        'PySide6.QtWebEngineCore',
+        'qasync',
     ],
     hookspath=[],
     hooksconfig={},
@@ -76,12 +76,14 @@ a_glink = Analysis(
         'PySide6.QtGui',
         'PySide6.QtWidgets',
         'PySide6.QtWebEngineWidgets',
+        'PySide6.QtWebEngineCore',
         'PySide6.QtWebChannel',
         'google.auth',
         'google.oauth2',
         'googleapiclient',
         'pandas',
-        'appdirs',
+        'pyarrow',
+        'python_calamine',
     ],
     hookspath=[],
     hooksconfig={},
@@ -133,7 +135,8 @@ a_merger = Analysis(
         'PySide6.QtWebEngineWidgets',
         'PySide6.QtWebChannel',
         'pikepdf',
-        'appdirs',
+        'pybase64',
+        'orjson',
         'datetime',
     ],
     hookspath=[],
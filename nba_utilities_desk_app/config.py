@@ -4,22 +4,50 @@ Handles paths, settings, and environment detection for production deployment
 """
 import os
 import sys
+from functools import cached_property
 from pathlib import Path
-import appdirs
+
+
+def _user_data_dir(app, author):
+    """Platform user data directory, matching appdirs' layout"""
+    if sys.platform == 'win32':
+        base = Path(os.environ.get('LOCALAPPDATA') or Path.home() / "AppData" / "Local")
+        return base / author / app
+    if sys.platform == 'darwin':
+        return Path.home() / "Library" / "Application Support" / app
+    return Path(os.environ.get('XDG_DATA_HOME') or Path.home() / ".local" / "share") / app
+
+
+def _user_cache_dir(app, author):
+    """Platform user cache directory, matching appdirs' layout"""
+    if sys.platform == 'win32':
+        return _user_data_dir(app, author) / "Cache"
+    if sys.platform == 'darwin':
+        return Path.home() / "Library" / "Caches" / app
+    return Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / ".cache") / app
 
 
 class AppConfig:
-    """Application configuration with proper path handling"""
+    """Application configuration with proper path handling
+    
+    Only the environment detection runs at import time. Every path is a
+    cached_property, so directories are only created on first use by the
+    process that actually needs them.
+    """
     
     APP_NAME = "NBA_Utilities"
     APP_AUTHOR = "NBA"
     VERSION = "1.0.0"
+    PREWARM_ENV = "NBA_PREWARM"  # Set by the launcher on pre-spawned tools
+    
+    # Directories already created by this process
+    _ensured = set()
     
     def __init__(self):
         self._setup_paths()
     
     def _setup_paths(self):
-        """Setup all application paths based on environment"""
+        """Setup the environment-dependent base paths"""
         
         # Detect if running as PyInstaller bundle
         self.is_frozen = getattr(sys, 'frozen', False)
@@ -32,49 +60,110 @@ class AppConfig:
             # Running as script
             self.base_path = os.path.dirname(os.path.abspath(__file__))
             self.exe_dir = self.base_path
+    
+    @cached_property
+    def user_data_dir(self):
+        """User data directory (for credentials, tokens, etc.)
         
-        # User data directory (for credentials, tokens, etc.)
-        # Uses platform-specific locations:
-        # Windows: C:\Users\<user>\AppData\Local\NBA\NBA_Utilities
-        # macOS: ~/Library/Application Support/NBA_Utilities
-        # Linux: ~/.local/share/NBA_Utilities
-        self.user_data_dir = Path(appdirs.user_data_dir(self.APP_NAME, self.APP_AUTHOR))
-        self.user_data_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Downloads directory
-        self.downloads_dir = Path.home() / "Downloads"
-        self.downloads_dir.mkdir(exist_ok=True)
-        
-        # Temp directory for processing
-        self.temp_dir = Path(appdirs.user_cache_dir(self.APP_NAME, self.APP_AUTHOR))
-        self.temp_dir.mkdir(parents=True, exist_ok=True)
-        
-        # HTML files (bundled with app)
-        self.home_html = self._get_resource_path("nba-utilities-home.html")
-        self.glink_html = self._get_resource_path("nba-drive-downloader.html")
-        self.merger_html = self._get_resource_path("nba-pdf-merger.html")
-        
-        # Icon file
-        self.icon_path = self._get_resource_path("icon.ico")
-        
-        # GLink specific paths (stored in user data)
-        self.glink_credentials = self.user_data_dir / "credentials.json"
-        self.glink_token = self.user_data_dir / "token.json"
-        
-        # Sub-executable paths (for child processes)
+        Uses platform-specific locations:
+        Windows: C:\\Users\\<user>\\AppData\\Local\\NBA\\NBA_Utilities
+        macOS: ~/Library/Application Support/NBA_Utilities
+        Linux: ~/.local/share/NBA_Utilities
+        """
+        return self._ensure(_user_data_dir(self.APP_NAME, self.APP_AUTHOR))
+    
+    @cached_property
+    def downloads_dir(self):
+        """Downloads directory"""
+        return self._ensure(Path.home() / "Downloads")
+    
+    @cached_property
+    def temp_dir(self):
+        """Temp directory for processing"""
+        return self._ensure(_user_cache_dir(self.APP_NAME, self.APP_AUTHOR))
+    
+    # HTML files (bundled with app)
+    @cached_property
+    def home_html(self):
+        return self._get_resource_path("nba-utilities-home.html")
+    
+    @cached_property
+    def glink_html(self):
+        return self._get_resource_path("nba-drive-downloader.html")
+    
+    @cached_property
+    def merger_html(self):
+        return self._get_resource_path("nba-pdf-merger.html")
+    
+    @cached_property
+    def icon_path(self):
+        return self._get_resource_path("icon.ico")
+    
+    # GLink specific paths (stored in user data)
+    @cached_property
+    def glink_credentials(self):
+        return self.user_data_dir / "credentials.json"
+    
+    @cached_property
+    def glink_token(self):
+        return self.user_data_dir / "token.json"
+    
+    # GLink download cache (kept in user data so it survives cleanup_temp)
+    @cached_property
+    def glink_cache_db(self):
+        return self.user_data_dir / "glink_cache.db"
+    
+    @cached_property
+    def glink_cache_dir(self):
+        return self.user_data_dir / "glink_files"
+    
+    # Home page with the nbatool:// navigation bridge spliced in at its
+    # <!--NBA_BRIDGE--> marker, plus the hash of the sources it was built from
+    @cached_property
+    def merged_html(self):
+        return self.user_data_dir / "home-merged.html"
+    
+    @cached_property
+    def merged_html_hash(self):
+        return self.user_data_dir / "home-merged.sha256"
+    
+    # Sub-executable paths (for child processes)
+    @cached_property
+    def glink_exe(self):
         if self.is_frozen:
             # When frozen, sub-apps are in subdirectories
-            self.glink_exe = Path(self.exe_dir) / "GLink" / "NBA_GLink_Extractor.exe"
-            self.merger_exe = Path(self.exe_dir) / "PDFMerger" / "NBA_PDF_Merger.exe"
-        else:
-            # When running as script, use Python files
-            self.glink_exe = Path(self.base_path) / "Glink.py"
-            self.merger_exe = Path(self.base_path) / "merger.py"
+            return Path(self.exe_dir) / "GLink" / "NBA_GLink_Extractor.exe"
+        # When running as script, use Python files
+        return Path(self.base_path) / "Glink.py"
+    
+    @cached_property
+    def merger_exe(self):
+        if self.is_frozen:
+            return Path(self.exe_dir) / "PDFMerger" / "NBA_PDF_Merger.exe"
+        return Path(self.base_path) / "merger.py"
+    
+    def _ensure(self, path):
+        """Create a directory once per process and return it"""
+        if path not in self._ensured:
+            path.mkdir(parents=True, exist_ok=True)
+            self._ensured.add(path)
+        return path
     
     def _get_resource_path(self, relative_path):
         """Get absolute path to bundled resource"""
         return os.path.join(self.base_path, relative_path)
     
+    def wait_if_prewarmed(self):
+        """Hold a pre-spawned tool until the launcher sends GO on stdin
+        
+        Returns False when the tool should exit instead (launcher closed the
+        pipe or there is no stdin to wait on). Normal launches return True
+        immediately.
+        """
+        if os.environ.pop(self.PREWARM_ENV, None) != "1":
+            return True
+        return sys.stdin is not None and sys.stdin.readline().strip() == "GO"
+    
     def get_temp_file(self, filename):
         """Get path for temporary file"""
         return self.temp_dir / filename
@@ -85,7 +174,8 @@ class AppConfig:
         if self.temp_dir.exists():
             try:
                 shutil.rmtree(self.temp_dir, ignore_errors=True)
-                self.temp_dir.mkdir(parents=True, exist_ok=True)
+                self._ensured.discard(self.temp_dir)
+                self._ensure(self.temp_dir)
             except Exception as e:
                 print(f"[WARN] Could not clean temp directory: {e}")
 
@@ -4,48 +4,169 @@ Robust main launcher with proper error handling and resource management
 """
 import os
 import sys
+import asyncio
 import subprocess
+import select
 import signal
 import atexit
+import hashlib
+import json
 import logging
+import logging.handlers
+import tempfile
 from pathlib import Path
 from PySide6 import QtCore, QtGui
-from PySide6.QtCore import Slot, QObject, QUrl, QTimer
+from PySide6.QtCore import QObject, QUrl, QTimer
 from PySide6.QtWidgets import QApplication, QMainWindow, QMessageBox
-from PySide6.QtWebEngineWidgets import QWebEngineView
-from PySide6.QtWebChannel import QWebChannel
+import qasync
+from qasync import asyncSlot
 
 # Import configuration
 from config import config
 
-# Setup logging
+# Setup logging: WARNING unless NBA_LOG names another level; the rotating
+# log file is only opened once the first record is written
 log_file = config.user_data_dir / "nba_utilities.log"
 logging.basicConfig(
-    level=logging.INFO,
+    level=getattr(logging, os.environ.get('NBA_LOG', 'WARNING').upper(), logging.WARNING),
     format='%(asctime)s [%(levelname)s] %(message)s',
     handlers=[
-        logging.FileHandler(log_file),
+        logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=2_000_000, backupCount=3, delay=True),
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Launchable tools: key used by the page -> (display name, executable)
+TOOLS = {
+    'glink': ("GLink Extractor", config.glink_exe),
+    'pdf': ("PDF Merger", config.merger_exe),
+}
+
+# A tool still running after LAUNCH_GRACE seconds counts as launched
+LAUNCH_GRACE = 0.5
+LAUNCH_POLL_INTERVAL = 0.05
+
+# Script spliced into the home page; tool clicks navigate to TOOL_SCHEME
+# URLs that the page object turns into Bridge.navigateTo calls
+TOOL_SCHEME = "nbatool"
+BRIDGE_SCRIPT = """
+<script type="text/javascript">
+// Launch status toast, replaced by each new message
+const TOAST_COLORS = {info: '#1d428a', success: '#2e7d32', error: '#c8102e'};
+let toastTimer = null;
+
+window.showLaunchToast = function(text, kind) {
+    let toast = document.getElementById('nba-launch-toast');
+    if (!toast) {
+        toast = document.createElement('div');
+        toast.id = 'nba-launch-toast';
+        toast.style.cssText =
+            'position:fixed;left:50%;bottom:32px;transform:translateX(-50%);' +
+            'padding:12px 20px;border-radius:8px;color:#fff;font:14px sans-serif;' +
+            'white-space:pre-line;z-index:9999;pointer-events:none;' +
+            'box-shadow:0 4px 12px rgba(0,0,0,.3);transition:opacity .2s';
+        document.body.appendChild(toast);
+    }
+    toast.textContent = text;
+    toast.style.background = TOAST_COLORS[kind] || TOAST_COLORS.info;
+    toast.style.opacity = '1';
+    clearTimeout(toastTimer);
+    toastTimer = setTimeout(function() {
+        toast.style.opacity = '0';
+    }, kind === 'error' ? 4000 : 1500);
+};
+
+// Collapse click bursts before they reach Python
+const NAVIGATE_DEBOUNCE_MS = 800;
+let lastNavigate = 0;
+
+window.navigateTo = function(tool) {
+    const now = Date.now();
+    if (now - lastNavigate < NAVIGATE_DEBOUNCE_MS) {
+        return;
+    }
+    lastNavigate = now;
+    // Intercepted by the page's navigation hook; the page never leaves home
+    window.location.href = 'nbatool://' + encodeURIComponent(tool);
+};
+</script>
+"""
+_BRIDGE_BYTES = BRIDGE_SCRIPT.encode('utf-8')
+# The home page marks where the bridge goes; </head> is only the fallback
+_BRIDGE_MARKER = b"<!--NBA_BRIDGE-->"
+_HEAD_END = b"</head>"
+
+
+def _write_atomic(path, data):
+    """Write bytes to path via a temp file + rename so readers never see a partial file"""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _create_tool_page(parent, launch):
+    """Build a web page that hands nbatool://<tool> navigations to launch(tool)
+    
+    QtWebEngine is imported lazily (see MainWindow._setup_webview), so the
+    page subclass is defined on first use.
+    """
+    from PySide6.QtWebEngineCore import QWebEnginePage
+    
+    class ToolPage(QWebEnginePage):
+        def acceptNavigationRequest(self, url, nav_type, is_main_frame):
+            if url.scheme() == TOOL_SCHEME:
+                launch(url.host())
+                return False
+            return super().acceptNavigationRequest(url, nav_type, is_main_frame)
+    
+    return ToolPage(parent)
+
+
+def _pidfd_supported():
+    """Check for pidfd_open (Python 3.9+ on Linux 5.3+)"""
+    if not hasattr(os, 'pidfd_open'):
+        return False
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+        return True
+    except OSError:
+        return False
+
 
 class Bridge(QObject):
     """Enhanced bridge with robust process management"""
     
     error_occurred = QtCore.Signal(str)
+    toast_requested = QtCore.Signal(str, str)  # text, kind
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.child_processes = []
-        self.launching = False
+        self.child_processes = {}  # pid -> Popen
+        self._alive_by_tool = {}  # tool name -> pid of its running process
+        self._warm = {}  # tool name -> pre-spawned process waiting for GO
+        self._prewarm_failed = set()
+        self._launch_lock = None  # Created in navigateTo, once the qasync loop runs
         self.launch_timeout = 10000  # 10 seconds
+        self._cleaned_up = False
+        self._cmds = self._resolve_commands()  # tool -> command line
+        self._exit_watchers = {}  # pid -> (pidfd, QSocketNotifier)
+        self._exit_waiters = {}  # pid -> Future resolved by the pidfd notifier
         
         atexit.register(self.cleanup_processes)
         
-        # Setup signal handlers for Unix-like systems
-        if sys.platform != 'win32':
+        # Child exits are delivered per process through a pidfd where the
+        # kernel supports it; SIGCHLD reaping is only the fallback
+        self.use_pidfd = _pidfd_supported()
+        if self.use_pidfd:
+            logger.info("Watching child processes with pidfd")
+        elif sys.platform != 'win32':
             try:
                 signal.signal(signal.SIGCHLD, self._handle_sigchld)
                 logger.info("SIGCHLD handler registered")
@@ -59,158 +180,269 @@ class Bridge(QObject):
                 pid, status = os.waitpid(-1, os.WNOHANG)
                 if pid == 0:
                     break
-                logger.info(f"Reaped zombie process PID: {pid}")
-                self.child_processes = [p for p in self.child_processes 
-                                       if p.poll() is not None or p.pid != pid]
+                logger.debug(f"Reaped zombie process PID: {pid}")
+                self._forget(pid)
             except ChildProcessError:
                 break
             except Exception as e:
                 logger.warning(f"SIGCHLD handler error: {e}")
                 break
     
-    @Slot(str)
-    def navigateTo(self, tool: str):
+    @asyncSlot(str)
+    async def navigateTo(self, tool: str):
         """Launch tool with comprehensive error handling"""
-        if self.launching:
-            QMessageBox.information(None, "Please Wait", 
-                                   "Another tool is launching. Please wait...")
+        if self._launch_lock is None:
+            # Before Python 3.10 a Lock binds to the loop current at creation
+            self._launch_lock = asyncio.Lock()
+        if self._launch_lock.locked():
+            self._notify("Another tool is launching. Please wait...")
             return
         
-        self.launching = True
-        
-        # Show loading message
-        loading_msg = QMessageBox(
-            QMessageBox.Information,
-            "Launching",
-            f"Starting {tool.upper()} tool...\nPlease wait...",
-            QMessageBox.NoButton
-        )
-        loading_msg.setWindowModality(QtCore.Qt.NonModal)
-        loading_msg.show()
-        QApplication.processEvents()
-        
-        try:
-            if tool == "glink":
-                self._launch_glink(loading_msg)
-            elif tool == "pdf":
-                self._launch_pdf(loading_msg)
-            else:
-                loading_msg.close()
-                QMessageBox.warning(None, "Unknown Tool", 
-                                   f"Tool '{tool}' is not recognized.")
-        except Exception as e:
-            loading_msg.close()
-            error_msg = f"Failed to launch {tool}: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            QMessageBox.critical(None, "Launch Error", error_msg)
-            self.error_occurred.emit(error_msg)
-        finally:
-            self.launching = False
+        async with self._launch_lock:
+            self._notify(f"Starting {tool.upper()} tool...")
+            
+            try:
+                if tool not in TOOLS:
+                    self._notify(f"Tool '{tool}' is not recognized.", "error")
+                    return
+                
+                tool_name, _ = TOOLS[tool]
+                process = self._launch_tool(tool, tool_name)
+                
+                if process is not None:
+                    await self._verify_launch(tool_name, process)
+            except Exception as e:
+                error_msg = f"Failed to launch {tool}: {str(e)}"
+                logger.error(error_msg, exc_info=True)
+                self._notify(error_msg, "error")
+                self.error_occurred.emit(error_msg)
     
-    def _launch_glink(self, loading_msg):
-        """Launch GLink Extractor"""
-        logger.info("Launching GLink Extractor...")
+    def _notify(self, text, kind="info"):
+        """Show a toast in the home page (kind: info, success or error)"""
+        self.toast_requested.emit(text, kind)
+    
+    def _launch_tool(self, tool, tool_name):
+        """Launch a tool from its pre-resolved command; None if already running"""
+        logger.info(f"Launching {tool_name}...")
         
         # Check if already running
-        if any(p.poll() is None for p in self.child_processes 
-               if hasattr(p, '_tool_name') and p._tool_name == 'glink'):
-            loading_msg.close()
-            logger.warning("GLink Extractor already running")
-            QMessageBox.information(None, "Already Running", 
-                                   "GLink Extractor is already running.")
-            return
-        
-        # Determine command
-        if config.is_frozen and config.glink_exe.exists():
-            cmd = [str(config.glink_exe)]
-            logger.info(f"Using bundled executable: {config.glink_exe}")
-        elif config.glink_exe.exists() and config.glink_exe.suffix == '.py':
-            cmd = [sys.executable, str(config.glink_exe)]
-            logger.info(f"Using Python script: {config.glink_exe}")
+        if self._is_running(tool):
+            logger.warning(f"{tool_name} already running")
+            self._notify(f"{tool_name} is already running.")
+            return None
+        
+        cmd = self._cmds.get(tool)
+        if cmd is None:
+            raise FileNotFoundError(f"{tool_name} executable not found")
+        
+        # Launch process, handing over the pre-spawned one when available
+        process = self._take_warm(tool) or self._launch_process(cmd, tool_name)
+        process._tool_name = tool
+        self.child_processes[process.pid] = process
+        self._alive_by_tool[tool] = process.pid
+        # The replacement warm instance is spawned once this one exits (see
+        # _forget): until then the tool cannot be launched again, and spawning
+        # now would compete with its cold start
+        return process
+    
+    def _resolve_commands(self):
+        """Resolve every tool's command line once, at startup"""
+        cmds = {}
+        for tool, (tool_name, exe) in TOOLS.items():
+            try:
+                cmds[tool] = self._tool_command(exe, tool_name)
+            except FileNotFoundError as e:
+                logger.warning(str(e))
+        return cmds
+    
+    def _tool_command(self, exe, tool_name):
+        """Build the command line for a tool executable or script"""
+        if config.is_frozen and exe.exists():
+            logger.info(f"Using bundled executable: {exe}")
+            return [str(exe)]
+        elif exe.exists() and exe.suffix == '.py':
+            logger.info(f"Using Python script: {exe}")
+            return [sys.executable, str(exe)]
         else:
-            raise FileNotFoundError(f"GLink executable not found: {config.glink_exe}")
-        
-        # Launch process
-        process = self._launch_process(cmd, "GLink Extractor")
-        process._tool_name = 'glink'
-        self.child_processes.append(process)
-        
-        # Verify launch
-        QTimer.singleShot(500, lambda: self._verify_launch(
-            loading_msg, "GLink Extractor", process))
+            raise FileNotFoundError(f"{tool_name} executable not found: {exe}")
     
-    def _launch_pdf(self, loading_msg):
-        """Launch PDF Merger"""
-        logger.info("Launching PDF Merger...")
-        
-        # Check if already running
-        if any(p.poll() is None for p in self.child_processes 
-               if hasattr(p, '_tool_name') and p._tool_name == 'pdf'):
-            loading_msg.close()
-            logger.warning("PDF Merger already running")
-            QMessageBox.information(None, "Already Running", 
-                                   "PDF Merger is already running.")
+    def prewarm(self):
+        """Pre-spawn each tool so the first click skips interpreter and Qt startup"""
+        for tool, (tool_name, _) in TOOLS.items():
+            if tool in self._cmds:
+                self._spawn_warm(tool, self._cmds[tool], tool_name)
+    
+    def _spawn_warm(self, tool, cmd, tool_name):
+        """Start a tool instance that waits on stdin for GO before showing"""
+        if self._cleaned_up or tool in self._warm or tool in self._prewarm_failed:
             return
+        try:
+            process = self._launch_process(cmd, f"{tool_name} (prewarm)", prewarm=True)
+        except Exception as e:
+            logger.warning(f"Prewarm of {tool_name} failed: {e}")
+            return
+        process._tool_name = tool
+        self._warm[tool] = process
+    
+    def _take_warm(self, tool):
+        """Release the pre-spawned tool instance, or None to cold-launch"""
+        process = self._warm.pop(tool, None)
+        if process is None:
+            return None
+        
+        if process.poll() is not None:
+            # Died while waiting (e.g. no usable stdin); stop prewarming this tool
+            logger.warning(f"Prewarmed {tool} exited with code {process.returncode}")
+            self._prewarm_failed.add(tool)
+            return None
         
-        # Determine command
-        if config.is_frozen and config.merger_exe.exists():
-            cmd = [str(config.merger_exe)]
-            logger.info(f"Using bundled executable: {config.merger_exe}")
-        elif config.merger_exe.exists() and config.merger_exe.suffix == '.py':
-            cmd = [sys.executable, str(config.merger_exe)]
-            logger.info(f"Using Python script: {config.merger_exe}")
-        else:
-            raise FileNotFoundError(f"PDF Merger executable not found: {config.merger_exe}")
-        
-        # Launch process
-        process = self._launch_process(cmd, "PDF Merger")
-        process._tool_name = 'pdf'
-        self.child_processes.append(process)
-        
-        # Verify launch
-        QTimer.singleShot(500, lambda: self._verify_launch(
-            loading_msg, "PDF Merger", process))
+        try:
+            process.stdin.write(b"GO\n")
+            process.stdin.close()
+        except OSError as e:
+            logger.warning(f"Could not hand over prewarmed {tool}: {e}")
+            process.kill()
+            return None
+        
+        logger.info(f"Using prewarmed {tool} (PID {process.pid})")
+        return process
     
-    def _launch_process(self, cmd, tool_name):
+    def _launch_process(self, cmd, tool_name, prewarm=False):
         """Launch subprocess with proper flags"""
-        creation_flags = 0
         if sys.platform == 'win32':
-            creation_flags = subprocess.CREATE_NEW_PROCESS_GROUP
+            options = {
+                'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP,
+                'cwd': str(config.exe_dir) if config.is_frozen else None,
+            }
+        else:
+            # Keeps CPython on its posix_spawn path (vfork on glibc) instead of
+            # fork+exec, which copies the page tables of this QtWebEngine
+            # process. That path needs close_fds=False (fds are non-inheritable
+            # by default anyway), no cwd and an absolute executable; the tools
+            # locate their files from sys.executable, not the working directory.
+            options = {'close_fds': False}
+        
+        if prewarm:
+            options['stdin'] = subprocess.PIPE
+            options['env'] = {**os.environ, config.PREWARM_ENV: "1"}
         
         try:
             process = subprocess.Popen(
                 cmd,
-                creationflags=creation_flags,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
-                cwd=str(config.exe_dir) if config.is_frozen else None
+                **options
             )
-            logger.info(f"{tool_name} launched with PID: {process.pid}")
+            logger.debug(f"{tool_name} launched with PID: {process.pid}")
+            if self.use_pidfd:
+                self._watch_exit(process)
             return process
         except Exception as e:
             logger.error(f"Failed to launch {tool_name}: {e}", exc_info=True)
             raise
     
-    def _verify_launch(self, loading_msg, tool_name, process):
-        """Verify tool launched successfully"""
-        loading_msg.close()
+    def _watch_exit(self, process):
+        """Get notified through a pidfd when the child exits"""
+        try:
+            fd = os.pidfd_open(process.pid)
+        except OSError as e:
+            logger.warning(f"pidfd_open failed for PID {process.pid}: {e}")
+            return
+        
+        notifier = QtCore.QSocketNotifier(fd, QtCore.QSocketNotifier.Type.Read, self)
+        notifier.activated.connect(lambda *_: self._on_child_exit(process))
+        self._exit_watchers[process.pid] = (fd, notifier)
+    
+    def _on_child_exit(self, process):
+        """Harvest an exited child and drop its watcher"""
+        fd, notifier = self._exit_watchers.pop(process.pid, (None, None))
+        if notifier is not None:
+            notifier.setEnabled(False)
+            notifier.deleteLater()
+        if fd is not None:
+            os.close(fd)
+        
+        returncode = process.poll()
+        logger.info(f"Process {process.pid} exited with code {returncode}")
+        self._forget(process.pid)
+        
+        exited = self._exit_waiters.get(process.pid)
+        if exited is not None and not exited.done():
+            exited.set_result(returncode)
+    
+    def _forget(self, pid):
+        """Drop an exited child from the tracking tables"""
+        for tool, warm in list(self._warm.items()):
+            if warm.pid == pid:
+                # An idle instance should never exit on its own
+                logger.warning(f"Prewarmed {tool} exited before use")
+                del self._warm[tool]
+                self._prewarm_failed.add(tool)
+        
+        process = self.child_processes.pop(pid, None)
+        tool = getattr(process, '_tool_name', None)
+        if tool is not None and self._alive_by_tool.get(tool) == pid:
+            del self._alive_by_tool[tool]
+            if not self._cleaned_up and tool in self._cmds:
+                # Re-arm the tool for its next launch once the loop is idle
+                QTimer.singleShot(0, lambda: self._spawn_warm(
+                    tool, self._cmds[tool], TOOLS[tool][0]))
+    
+    def _is_running(self, tool):
+        """Check whether the tool's last launched process is still alive"""
+        process = self.child_processes.get(self._alive_by_tool.get(tool))
+        return process is not None and process.poll() is None
+    
+    async def _verify_launch(self, tool_name, process):
+        """Verify tool launched successfully
+        
+        Resolves as soon as the child exits, or once it has stayed up for
+        LAUNCH_GRACE seconds, without blocking the event loop in between.
+        With pidfd watching the exit is event-driven; otherwise it is polled.
+        """
+        loop = asyncio.get_running_loop()
+        if process.pid in self._exit_watchers:
+            # The pidfd notifier resolves this the moment the child exits
+            exited = self._exit_waiters[process.pid] = loop.create_future()
+            try:
+                await asyncio.wait_for(exited, LAUNCH_GRACE)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self._exit_waiters.pop(process.pid, None)
+        else:
+            deadline = loop.time() + LAUNCH_GRACE
+            while process.poll() is None and loop.time() < deadline:
+                await asyncio.sleep(LAUNCH_POLL_INTERVAL)
         
-        if process.poll() is None:
-            QMessageBox.information(None, "Success", 
-                                   f"{tool_name} launched successfully!")
+        returncode = process.poll()
+        if returncode is None:
+            self._notify(f"{tool_name} launched successfully!", "success")
         else:
-            returncode = process.poll()
             error_msg = f"{tool_name} exited unexpectedly (code: {returncode})"
             logger.error(error_msg)
-            QMessageBox.warning(None, "Launch Issue", 
-                              f"{error_msg}\n\nCheck logs at:\n{log_file}")
+            self._notify(f"{error_msg}\nCheck logs at: {log_file}", "error")
             self.error_occurred.emit(error_msg)
     
     def cleanup_processes(self):
-        """Terminate all child processes gracefully"""
+        """Terminate all child processes gracefully
+        
+        Runs from both closeEvent and atexit; only the first call does work.
+        """
+        if self._cleaned_up:
+            return
+        self._cleaned_up = True
         logger.info("Cleaning up child processes...")
         
-        for process in self.child_processes:
+        # Idle prewarmed tools exit on their own once their stdin closes
+        for process in self._warm.values():
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+        
+        # Snapshot: exit notifications may drop entries while we wait
+        for process in list(self.child_processes.values()) + list(self._warm.values()):
             if process and process.poll() is None:
                 try:
                     tool_name = getattr(process, '_tool_name', 'Unknown')
@@ -221,13 +453,12 @@ class Bridge(QObject):
                     else:
                         process.send_signal(signal.SIGTERM)
                     
-                    try:
-                        process.wait(timeout=3)
+                    if self._wait_exit(process, 3):
                         logger.info(f"Process {process.pid} terminated gracefully")
-                    except subprocess.TimeoutExpired:
+                    else:
                         logger.warning(f"Forcing kill on PID {process.pid}...")
                         process.kill()
-                        process.wait()
+                        self._wait_exit(process, None)
                         logger.info(f"Process {process.pid} killed")
                 except Exception as e:
                     logger.warning(f"Error terminating process: {e}")
@@ -237,14 +468,46 @@ class Bridge(QObject):
                         pass
         
         self.child_processes.clear()
+        self._alive_by_tool.clear()
+        self._warm.clear()
         logger.info("Cleanup complete")
 
 
+    def _wait_exit(self, process, timeout):
+        """Wait up to timeout seconds (None: forever) for a child; True once reaped
+        
+        A watched child is waited on through its pidfd: one poll() for
+        readiness, then a single waitid() to reap it.
+        """
+        watcher = self._exit_watchers.get(process.pid)
+        if watcher is None:
+            try:
+                process.wait(timeout=timeout)
+                return True
+            except subprocess.TimeoutExpired:
+                return False
+        
+        fd = watcher[0]
+        poller = select.poll()
+        poller.register(fd, select.POLLIN)
+        if not poller.poll(None if timeout is None else timeout * 1000):
+            return False
+        
+        info = os.waitid(os.P_PIDFD, fd, os.WEXITED)
+        if info is not None:
+            # Mirror Popen's convention: negative returncode for a signal
+            process.returncode = (info.si_status if info.si_code == os.CLD_EXITED
+                                  else -info.si_status)
+        self._on_child_exit(process)
+        return True
+
+
 class MainWindow(QMainWindow):
     """Enhanced main window with better error handling"""
     
-    def __init__(self):
+    def __init__(self, screen_geometry=None):
         super().__init__()
+        self._screen_geometry = screen_geometry
         self._setup_window()
         self._setup_webview()
         self._load_content()
@@ -266,32 +529,44 @@ class MainWindow(QMainWindow):
     def _center_on_screen(self):
         """Center window on screen"""
         try:
-            screen_geometry = QApplication.primaryScreen().geometry()
-            window_geometry = self.frameGeometry()
-            center_point = screen_geometry.center()
-            window_geometry.moveCenter(center_point)
+            screen_geometry = (self._screen_geometry
+                               or QApplication.primaryScreen().availableGeometry())
+            # The frame is not sized before show(), so center the client size
+            window_geometry = QtCore.QRect(QtCore.QPoint(0, 0), self.size())
+            window_geometry.moveCenter(screen_geometry.center())
             self.move(window_geometry.topLeft())
         except Exception as e:
             logger.warning(f"Could not center window: {e}")
     
     def _setup_webview(self):
         """Setup web view with bridge"""
+        # Imported here so startup failures are reported before Chromium loads
+        from PySide6.QtWebEngineWidgets import QWebEngineView
+        
         self.view = QWebEngineView(self)
         self.setCentralWidget(self.view)
         
-        # Setup WebChannel
-        self.channel = QWebChannel()
+        # Tool clicks arrive as nbatool:// navigations rather than over a
+        # WebChannel, so no qwebchannel.js has to load
         self.bridge = Bridge()
-        self.channel.registerObject("pybridge", self.bridge)
-        self.view.page().setWebChannel(self.channel)
+        self.view.setPage(_create_tool_page(self.view, self.bridge.navigateTo))
         
-        # Connect error signal
+        # Connect bridge signals
         self.bridge.error_occurred.connect(self._handle_bridge_error)
+        self.bridge.toast_requested.connect(self._show_toast)
+        
+        # Start idle tool instances once the launcher itself is up
+        QTimer.singleShot(0, self.bridge.prewarm)
     
     def _handle_bridge_error(self, error_msg):
         """Handle errors from bridge"""
         logger.error(f"Bridge error: {error_msg}")
     
+    def _show_toast(self, text, kind):
+        """Forward a launch status message to the page's toast"""
+        self.view.page().runJavaScript(
+            f"window.showLaunchToast({json.dumps(text)}, {json.dumps(kind)})")
+    
     def _load_content(self):
         """Load HTML content with bridge injection"""
         try:
@@ -300,56 +575,40 @@ class MainWindow(QMainWindow):
             if not os.path.exists(html_path):
                 raise FileNotFoundError(f"HTML file not found: {html_path}")
             
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
-            # Get WebChannel JavaScript
-            js_file = QtCore.QFile(":/qtwebchannel/qwebchannel.js")
-            if not js_file.open(QtCore.QIODevice.ReadOnly):
-                raise Exception("Failed to load qwebchannel.js")
-            
-            qwebchannel_js = js_file.readAll().data().decode('utf-8')
-            js_file.close()
-            
-            # Inject bridge script
-            bridge_script = f"""
-            <script type="text/javascript">
-            {qwebchannel_js}
-            </script>
-            <script type="text/javascript">
-            window.bridgeReady = false;
-            
-            function callBridgeSafely(method, ...args) {{
-                if (window.bridgeReady && typeof method === 'function') {{
-                    return method(...args);
-                }} else {{
-                    console.error('Bridge not ready');
-                    alert('Application is still loading. Please wait...');
-                    return Promise.reject('Bridge not ready');
-                }}
-            }}
-            
-            document.addEventListener('DOMContentLoaded', function() {{
-                new QWebChannel(qt.webChannelTransport, function(channel) {{
-                    window.pybridge = channel.objects.pybridge;
-                    window.bridgeReady = true;
-                    console.log('[BRIDGE] Connected successfully');
-                }});
-            }});
+            # Reuse the merged page from a previous run while its sources are
+            # unchanged, so startup is a plain file:// load
+            stat = os.stat(html_path)
+            digest = hashlib.sha256(
+                f"{stat.st_mtime_ns}:{stat.st_size}:{BRIDGE_SCRIPT}".encode('utf-8')
+            ).hexdigest()
+            try:
+                if (config.merged_html_hash.read_text() == digest
+                        and config.merged_html.exists()):
+                    self.view.setUrl(QUrl.fromLocalFile(str(config.merged_html)))
+                    logger.info("HTML content loaded from cache")
+                    return
+            except OSError:
+                pass
             
-            window.navigateTo = function(tool) {{
-                callBridgeSafely(window.pybridge.navigateTo, tool);
-            }};
-            </script>
-            """
+            # Splice on the raw UTF-8 bytes; the page is never decoded in Python
+            html_content = Path(html_path).read_bytes()
             
-            if "</head>" in html_content:
-                html_content = html_content.replace("</head>", f"{bridge_script}</head>", 1)
+            if _BRIDGE_MARKER in html_content:
+                html_content = html_content.replace(_BRIDGE_MARKER, _BRIDGE_BYTES, 1)
+            elif _HEAD_END in html_content:
+                html_content = html_content.replace(_HEAD_END, _BRIDGE_BYTES + _HEAD_END, 1)
             else:
-                html_content += bridge_script
+                html_content += _BRIDGE_BYTES
             
-            base_url = QUrl.fromLocalFile(os.path.dirname(html_path) + "/")
-            self.view.setHtml(html_content, base_url)
+            try:
+                _write_atomic(config.merged_html, html_content)
+                _write_atomic(config.merged_html_hash, digest.encode('ascii'))
+                self.view.setUrl(QUrl.fromLocalFile(str(config.merged_html)))
+            except OSError as e:
+                logger.warning(f"Could not cache merged HTML, loading inline: {e}")
+                base_url = QUrl.fromLocalFile(os.path.dirname(html_path) + "/")
+                self.view.setContent(QtCore.QByteArray(html_content),
+                                     "text/html;charset=UTF-8", base_url)
             
             logger.info("HTML content loaded successfully")
             
@@ -371,8 +630,8 @@ class MainWindow(QMainWindow):
                 pass
         
         # Check for running processes
-        active_processes = [p for p in self.bridge.child_processes 
-                          if p and p.poll() is None]
+        active_processes = [p for p in list(self.bridge.child_processes.values())
+                            if p and p.poll() is None]
         
         if active_processes:
             reply = QMessageBox.question(
@@ -403,19 +662,23 @@ def main():
         QApplication.setHighDpiScaleFactorRoundingPolicy(
             QtCore.Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
         )
+        # QtWebEngine is imported after the QApplication exists, so the
+        # context sharing it needs has to be requested up front
+        QApplication.setAttribute(QtCore.Qt.AA_ShareOpenGLContexts)
         
         app = QApplication(sys.argv)
         app.setApplicationName("NBA Utilities")
         app.setOrganizationName("NBA")
         app.setApplicationVersion(config.VERSION)
         
-        logger.info("=" * 60)
-        logger.info(f"NBA UTILITIES v{config.VERSION} - STARTING")
-        logger.info(f"Running as: {'Frozen Executable' if config.is_frozen else 'Python Script'}")
-        logger.info(f"Base Path: {config.base_path}")
-        logger.info(f"User Data: {config.user_data_dir}")
-        logger.info(f"Log File: {log_file}")
-        logger.info("=" * 60)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("=" * 60)
+            logger.info(f"NBA UTILITIES v{config.VERSION} - STARTING")
+            logger.info(f"Running as: {'Frozen Executable' if config.is_frozen else 'Python Script'}")
+            logger.info(f"Base Path: {config.base_path}")
+            logger.info(f"User Data: {config.user_data_dir}")
+            logger.info(f"Log File: {log_file}")
+            logger.info("=" * 60)
         
         # Verify critical resources
         if not os.path.exists(config.home_html):
@@ -428,16 +691,21 @@ def main():
             sys.exit(1)
         
         # Create and show main window
-        window = MainWindow()
+        window = MainWindow(app.primaryScreen().availableGeometry())
         window.show()
         
         logger.info("Application started successfully")
         
-        # Run application
-        exit_code = app.exec()
+        # Run application on a qasync loop so bridge slots can be coroutines
+        loop = qasync.QEventLoop(app)
+        asyncio.set_event_loop(loop)
+        # run_forever returns once Qt quits; waiting on a future here would
+        # raise when Qt stops the loop before it completes
+        with loop:
+            loop.run_forever()
         
-        logger.info(f"Application exiting with code: {exit_code}")
-        sys.exit(exit_code)
+        logger.info("Application exiting with code: 0")
+        sys.exit(0)
         
     except Exception as e:
         logger.critical(f"Fatal error: {e}", exc_info=True)
@@ -3,19 +3,23 @@ import os
 import sys
 import base64
 import json
+import functools
+import hashlib
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PySide6 import QtCore
 from PySide6.QtGui import QIcon
-from PySide6.QtCore import Slot, QObject, QUrl, QThread, Signal
+from PySide6.QtCore import Slot, QObject, QUrl, QThread, Signal, QRunnable, QThreadPool
 from PySide6.QtWidgets import QApplication, QMainWindow, QMessageBox, QFileDialog
 from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWebChannel import QWebChannel
 import tempfile
 import subprocess
-import platform
 import io
+import shutil
 import time
+import threading
 from datetime import datetime
 
 # Import configuration
@@ -25,6 +29,13 @@ import logging
 # Setup logging
 logger = logging.getLogger(__name__)
 
+_IS_WINDOWS = sys.platform == 'win32'
+_IS_MAC = sys.platform == 'darwin'
+
+PROGRESS_INTERVAL = 0.05  # min seconds between worker progress signals
+PROGRESS_FLUSH_MS = 50  # coalescing window for progress sent to the page
+PRUNE_RESOURCES_MIN_PAGES = 100  # prune unused resources before copying larger sources
+
 try:
     import pikepdf
     PIKEPDF_AVAILABLE = True
@@ -32,6 +43,163 @@ except ImportError:
     PIKEPDF_AVAILABLE = False
     logger.warning("pikepdf not available")
 
+# SIMD base64 decoder with the stdlib signature; falls back to base64
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
+b64decode = pybase64.b64decode if PYBASE64_AVAILABLE else base64.b64decode
+
+# Faster JSON for the large file payloads crossing the bridge
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    _loads = orjson.loads
+    
+    def _dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+else:
+    _loads = json.loads
+    _dumps = json.dumps
+
+
+_PDF_MAGIC_B64 = 'JVBERi'
+
+
+def _move_or_copy(src, dst):
+    """Move a file, renaming in place when src and dst share a filesystem"""
+    try:
+        os.replace(src, dst)
+    except OSError:
+        # Cross-device; copy2 already copies in-kernel (sendfile on Linux,
+        # fcopyfile on macOS), so there is no userspace buffer to enlarge
+        shutil.copy2(src, dst)
+        os.unlink(src)
+
+
+def pdf_source(file_data):
+    """Return something pikepdf.open accepts for a file entry sent from JS
+    
+    Files chosen through PDFBridge.pickFiles carry their local 'path' and
+    are opened in place; drag-and-drop files still arrive as 'base64Data'.
+    """
+    path = file_data.get('path')
+    if path:
+        return path
+    
+    base64_data = file_data['base64Data']
+    if base64_data.startswith('data:'):
+        # Slice past the short header instead of split(), which also builds
+        # a list around the full payload
+        comma = base64_data.find(',')
+        if comma >= 0:
+            base64_data = base64_data[comma + 1:]
+    
+    # b'%PDF' always encodes to 'JVBERi', so non-PDFs are rejected before
+    # any decoding; lstrip() returns the same object when there is nothing
+    # to strip
+    base64_data = base64_data.lstrip()
+    if not base64_data.startswith(_PDF_MAGIC_B64):
+        raise ValueError("Invalid PDF header")
+    
+    try:
+        pdf_bytes = b64decode(base64_data, validate=True)
+    except Exception as b64_err:
+        raise ValueError(f"Corrupted base64 data: {str(b64_err)}")
+    
+    # Stays a BytesIO: it shares the bytes object's buffer without copying,
+    # while pikepdf.open would take raw bytes for a filename
+    return io.BytesIO(pdf_bytes)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_qwebchannel_js():
+    """Read qwebchannel.js from the Qt resources once per process"""
+    js_file = QtCore.QFile(":/qtwebchannel/qwebchannel.js")
+    if not js_file.open(QtCore.QIODevice.ReadOnly):
+        logger.error("Failed to load qwebchannel.js")
+        return None
+    
+    try:
+        return js_file.readAll().data().decode('utf-8')
+    finally:
+        js_file.close()
+
+
+@functools.lru_cache(maxsize=4)
+def _injected_html(html_path, mtime_ns):
+    """Merger page with the WebChannel bridge spliced in, cached per file version"""
+    # One unbuffered read to EOF; no BufferedReader/TextIOWrapper layer
+    html_content = Path(html_path).read_bytes().decode('utf-8')
+    
+    qwebchannel_js = _load_qwebchannel_js()
+    if qwebchannel_js is None:
+        return None
+    
+    bridge_script = f"""
+    <script type="text/javascript">
+    {qwebchannel_js}
+    </script>
+    <script type="text/javascript">
+    window.bridgeReady = false;
+    window.isDesktopMode = true;
+    window.pdfBridge = null;
+    
+    document.addEventListener('DOMContentLoaded', function() {{
+        console.log('[BRIDGE] Initializing WebChannel...');
+    
+        new QWebChannel(qt.webChannelTransport, function(channel) {{
+            window.pdfBridge = channel.objects.pdfBridge;
+            window.bridgeReady = true;
+    
+            window.pdfBridge.mergeProgress.connect(function(current, total, message) {{
+                window.updateMergeProgress(current, total, message);
+            }});
+            window.pdfBridge.mergeComplete.connect(function(resultJson) {{
+                window.handleMergeComplete(resultJson);
+            }});
+            window.pdfBridge.mergeError.connect(function(errorMsg) {{
+                window.handleMergeError(errorMsg);
+            }});
+    
+            console.log('[BRIDGE] Bridge connected successfully');
+    
+            if (typeof window.onBridgeReady === 'function') {{
+                window.onBridgeReady();
+            }}
+        }});
+    }});
+    </script>
+    """
+    
+    if "</head>" in html_content:
+        html_content = html_content.replace("</head>", f"{bridge_script}</head>", 1)
+    else:
+        html_content += bridge_script
+    
+    return html_content
+
+
+class _Task(QRunnable):
+    """Run a callable on the global thread pool"""
+    
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+    
+    def run(self):
+        # An exception escaping into the pool would be lost silently
+        try:
+            self.fn()
+        except Exception as e:
+            logger.error(f"Background task failed: {e}", exc_info=True)
+
 
 class MergeWorker(QThread):
     """Worker thread for PDF merging"""
@@ -60,7 +228,7 @@ class MergeWorker(QThread):
                 return
             
             result = self.merge_pdfs_pikepdf()
-            self.finished.emit(json.dumps(result))
+            self.finished.emit(_dumps(result))
             
         except Exception as e:
             error_msg = f"Merge failed: {str(e)}"
@@ -76,53 +244,60 @@ class MergeWorker(QThread):
         errors = []
         total_files = len(self.files_data)
         
+        # Decoding and parsing release the GIL, so every source is opened on
+        # a pool thread up front; pages are still appended in order here.
+        # Sources stay open until the merged file is saved, so their pages
+        # are written straight from the source documents.
+        executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+        opened = [executor.submit(self._open_file, file_data) for file_data in self.files_data]
+        
+        last_emit = 0.0
+        
         try:
-            for idx, file_data in enumerate(self.files_data):
+            for idx, (file_data, future) in enumerate(zip(self.files_data, opened)):
                 if self._is_cancelled:
                     raise Exception("Merge operation cancelled by user")
                 
                 filename = file_data['name']
                 is_encrypted = file_data.get('isEncrypted', False)
-                password = file_data.get('password', '')
                 
-                self.progress.emit(
-                    idx + 1, 
-                    total_files, 
-                    f"Processing: {filename} ({idx + 1}/{total_files})"
-                )
+                # Throttled; the first and last file are always reported
+                now = time.monotonic()
+                if idx == 0 or idx + 1 == total_files or now - last_emit >= PROGRESS_INTERVAL:
+                    last_emit = now
+                    self.progress.emit(
+                        idx + 1, 
+                        total_files, 
+                        f"Processing: {filename} ({idx + 1}/{total_files})"
+                    )
                 
                 try:
-                    base64_data = file_data['base64Data']
-                    if base64_data.startswith('data:'):
-                        base64_data = base64_data.split(',', 1)[1]
-                    
-                    try:
-                        pdf_bytes = base64.b64decode(base64_data, validate=True)
-                    except Exception as b64_err:
-                        raise ValueError(f"Corrupted base64 data: {str(b64_err)}")
-
-                    if not pdf_bytes.startswith(b'%PDF'):
-                        raise ValueError("Invalid PDF header")
-                    
-                    pdf_stream = io.BytesIO(pdf_bytes)
-                    
                     if is_encrypted and self.skip_encrypted:
                         errors.append(f"{filename}: Skipped (encrypted)")
                         failed += 1
                         continue
                     
-                    with pikepdf.open(pdf_stream, password=password) as pdf:
-                        page_count = len(pdf.pages)
-                        if page_count == 0:
-                            errors.append(f"{filename}: No pages found")
-                            failed += 1
-                            continue
-                        
-                        merger.pages.extend(pdf.pages)
-                        
-                        successful += 1
-                        total_pages_merged += page_count
-                        logger.info(f"Added {page_count} pages from {filename}")
+                    pdf, open_err = future.result()
+                    if open_err is not None:
+                        raise open_err
+                    
+                    page_count = len(pdf.pages)
+                    if page_count == 0:
+                        errors.append(f"{filename}: No pages found")
+                        failed += 1
+                        continue
+                    
+                    # Fewer objects to copy foreign when big sources carry
+                    # resources none of their pages use
+                    if page_count > PRUNE_RESOURCES_MIN_PAGES:
+                        pdf.remove_unreferenced_resources()
+                    
+                    # Resolve the page list once rather than per index
+                    merger.pages.extend(list(pdf.pages))
+                    
+                    successful += 1
+                    total_pages_merged += page_count
+                    logger.info(f"Added {page_count} pages from {filename}")
 
                 except pikepdf.PasswordError:
                     logger.error(f"Wrong password for {filename}")
@@ -141,13 +316,19 @@ class MergeWorker(QThread):
             self.progress.emit(total_files, total_files, "Finalizing and saving PDF...")
             
             try:
-                with open(self.output_path, 'wb') as output_file:
-                    merger.save(output_file)
-            except Exception as write_err:
+                # A path lets qpdf write the file natively rather than through
+                # Python file-object callbacks. Object streams, and page
+                # content copied without decoding
+                merger.save(
+                    self.output_path,
+                    object_stream_mode=pikepdf.ObjectStreamMode.generate,
+                    stream_decode_level=pikepdf.StreamDecodeLevel.none,
+                    linearize=False,
+                    recompress_flate=False,
+                )
+            except (pikepdf.PdfError, OSError) as write_err:
                 raise Exception(f"Failed to write merged PDF: {str(write_err)}")
             
-            merger.close()
-            
             if not os.path.exists(self.output_path):
                 raise Exception("Output file was not created")
             
@@ -174,31 +355,67 @@ class MergeWorker(QThread):
             raise
         finally:
             merger.close()
+            executor.shutdown(wait=True, cancel_futures=True)
+            for future in opened:
+                if not future.cancelled():
+                    pdf, _ = future.result()
+                    if pdf is not None:
+                        pdf.close()
+    
+    def _open_file(self, file_data):
+        """Decode and open one source on a pool thread; returns (pdf, error)"""
+        if file_data.get('isEncrypted', False) and self.skip_encrypted:
+            return None, None
+        try:
+            pdf = pikepdf.open(pdf_source(file_data), password=file_data.get('password', ''))
+            return pdf, None
+        except Exception as e:
+            return None, e
 
 
 class PDFBridge(QObject):
     """Bridge for Python-JS communication"""
     
+    # Delivered to the page over the WebChannel (connected in bridge_script)
+    mergeProgress = Signal(int, int, str)
+    mergeComplete = Signal(str)
+    mergeError = Signal(str)
+    encryptionBatchChecked = Signal(str, str)  # request id, JSON list of results
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.merge_worker = None
-        self.temp_files = []
+        # Per-session scratch space for decoded copies and merge output;
+        # removed as one tree by cleanup() or, failing that, at exit
+        self._tmpdir = tempfile.TemporaryDirectory(prefix='nba_merge_', dir=config.temp_dir)
+        self._tmpdir_path = Path(self._tmpdir.name)
         self.last_output_path = None
-        self.temp_view_files = []
         self.desired_output_filename = "merged.pdf"
+        # Dropped (base64) files are decoded once into a temp copy which the
+        # encryption check, viewer and merge then all open by path. Pool
+        # threads and the GUI thread share it, hence the lock.
+        self._decoded_cache = {}  # source key -> temp path
+        self._decoded_lock = threading.Lock()
+        
+        # Progress reaches the page at most once per PROGRESS_FLUSH_MS
+        self._pending_progress = None
+        self._progress_timer = QtCore.QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_FLUSH_MS)
+        self._progress_timer.timeout.connect(self.flush_progress)
     
     @Slot(str, str, bool)
     def startMerge(self, files_json, output_filename, skip_encrypted):
         """Start PDF merge operation"""
         try:
-            files_data = json.loads(files_json)
+            files_data = [self._cached_source(file_data) for file_data in _loads(files_json)]
             
             if not files_data:
                 self.handleError("No files provided for merging")
                 return
             
             # CHANGED: Use temp directory instead of downloads
-            temp_path = config.get_temp_file(f"merge_{int(time.time())}_{output_filename}")
+            temp_path = self._tmpdir_path / f"merge_{int(time.time())}_{output_filename}"
             if not str(temp_path).endswith('.pdf'):
                 temp_path = Path(str(temp_path) + '.pdf')
             
@@ -224,128 +441,210 @@ class PDFBridge(QObject):
             logger.error(error_msg, exc_info=True)
             self.handleError(error_msg)
     
-    @Slot(str, result=str)
-    def checkEncryption(self, file_json):
-        """Check if a PDF file is encrypted using pikepdf"""
-        if not PIKEPDF_AVAILABLE:
-            return json.dumps({'isEncrypted': False, 'type': 'none', 'error': 'pikepdf not installed'})
-            
-        try:
-            file_data = json.loads(file_json)
-            base64_data = file_data['base64Data']
-            
-            if base64_data.startswith('data:'):
-                base64_data = base64_data.split(',', 1)[1]
-            
-            try:
-                pdf_bytes = base64.b64decode(base64_data, validate=True)
-            except Exception as b64_err:
-                logger.error(f"Invalid base64: {b64_err}")
-                return json.dumps({'isEncrypted': False, 'type': 'none', 'error': 'Invalid base64'})
-            
-            if not pdf_bytes or not pdf_bytes.startswith(b'%PDF'):
-                logger.error("Invalid PDF header")
-                return json.dumps({'isEncrypted': False, 'type': 'none', 'error': 'Invalid PDF'})
-            
-            pdf_stream = io.BytesIO(pdf_bytes)
-            result = {}
-
+    @Slot(result=str)
+    def pickFiles(self):
+        """Choose PDFs with a native dialog; returns JSON [{name, path, size}]
+        
+        The page keeps only the paths, so nothing is base64-encoded in JS.
+        """
+        paths, _ = QFileDialog.getOpenFileNames(
+            None, "Select PDF Files", str(config.downloads_dir), "PDF Files (*.pdf)")
+        
+        picked = []
+        for path in paths:
             try:
-                with pikepdf.open(pdf_stream, password='') as pdf:
-                    if pdf.is_encrypted:
-                        result = {'isEncrypted': False, 'type': 'owner_only'}
-                        logger.info(f"Owner-only protected PDF: {file_data['name']}")
-                    else:
-                        result = {'isEncrypted': False, 'type': 'none'}
-                        logger.info(f"Not encrypted: {file_data['name']}")
-                        
-            except pikepdf.PasswordError:
-                result = {'isEncrypted': True, 'type': 'user_password'}
-                logger.info(f"User password required: {file_data['name']}")
-            except Exception as read_err:
-                logger.error(f"Failed to read PDF: {read_err}", exc_info=True)
-                result = {'isEncrypted': False, 'type': 'error', 'error': f'Cannot read PDF: {str(read_err)}'}
-            
-            return json.dumps(result)
+                size = os.path.getsize(path)
+            except OSError as e:
+                logger.warning(f"Skipping unreadable file {path}: {e}")
+                continue
+            picked.append({'name': os.path.basename(path), 'path': path, 'size': size})
+        
+        logger.info(f"Picked {len(picked)} file(s)")
+        return _dumps(picked)
+    
+    @Slot(str, str)
+    def checkEncryptionBatch(self, request_id, files_json):
+        """Check a list of PDF files off the GUI thread
+        
+        Results arrive through encryptionBatchChecked, in the same order and
+        tagged with request_id so the page can match them to their batch.
+        """
+        QThreadPool.globalInstance().start(_Task(
+            lambda: self.encryptionBatchChecked.emit(
+                request_id, self._check_encryption_batch(files_json))))
+    
+    def _check_encryption_batch(self, files_json):
+        """JSON list of results for a list of file entries
         
+        Never raises: the page waits for exactly one result per entry, so
+        failures come back as error entries instead.
+        """
+        try:
+            files_data = _loads(files_json)
         except Exception as e:
             logger.error(f"Encryption check failed: {e}", exc_info=True)
-            return json.dumps({'isEncrypted': False, 'type': 'none', 'error': str(e)})
+            return _dumps([])  # No entries to answer for; the page fills in errors
+        
+        if not PIKEPDF_AVAILABLE:
+            result = {'isEncrypted': False, 'type': 'none', 'error': 'pikepdf not installed'}
+            return _dumps([result] * len(files_data))
+        
+        results = []
+        for file_data in files_data:
+            try:
+                results.append(self._encryption_info(file_data))
+            except Exception as e:
+                logger.error(f"Encryption check failed: {e}", exc_info=True)
+                results.append({'isEncrypted': False, 'type': 'error', 'error': str(e)})
+        return _dumps(results)
+    
+    def _encryption_info(self, file_data):
+        """Classify one file entry as none, owner_only, user_password or error"""
+        try:
+            source = pdf_source(self._decode_once(file_data))
+        except (ValueError, KeyError, OSError) as src_err:
+            logger.error(f"Invalid PDF data: {src_err}")
+            return {'isEncrypted': False, 'type': 'none', 'error': str(src_err)}
+        
+        try:
+            with pikepdf.open(source, password='') as pdf:
+                if pdf.is_encrypted:
+                    logger.info(f"Owner-only protected PDF: {file_data['name']}")
+                    return {'isEncrypted': False, 'type': 'owner_only'}
+                logger.info(f"Not encrypted: {file_data['name']}")
+                return {'isEncrypted': False, 'type': 'none'}
+                
+        except pikepdf.PasswordError:
+            logger.info(f"User password required: {file_data['name']}")
+            return {'isEncrypted': True, 'type': 'user_password'}
+        except Exception as read_err:
+            logger.error(f"Failed to read PDF: {read_err}", exc_info=True)
+            return {'isEncrypted': False, 'type': 'error', 'error': f'Cannot read PDF: {str(read_err)}'}
     
     @Slot(str)
     def viewPDF(self, file_json):
         """View PDF in default viewer"""
         try:
-            file_data = json.loads(file_json)
+            file_data = _loads(file_json)
             filename = file_data['name']
-            base64_data = file_data['base64Data']
-            
-            if base64_data.startswith('data:'):
-                base64_data = base64_data.split(',', 1)[1]
             
             try:
-                pdf_bytes = base64.b64decode(base64_data, validate=True)
-            except Exception as b64_err:
-                self.handleError(f"Invalid PDF data: {b64_err}")
-                return
-            
-            if not pdf_bytes.startswith(b'%PDF'):
-                self.handleError("Invalid PDF file")
+                file_data = self._decode_once(file_data)
+            except ValueError as src_err:
+                self.handleError(f"Invalid PDF data: {src_err}")
                 return
             
-            safe_filename = "".join(c for c in filename if c.isalnum() or c in (' ', '.', '_', '-'))
-            temp_path = config.get_temp_file(f"view_{int(time.time())}_{safe_filename}")
-            
+            # Picked files are opened where they are, dropped ones from
+            # their decoded temp copy
             try:
-                with open(temp_path, 'wb') as f:
-                    f.write(pdf_bytes)
-                    f.flush()
-                    os.fsync(f.fileno())
-                
-                if sys.platform != 'win32':
-                    os.chmod(temp_path, 0o644)
-                
-                self.temp_view_files.append(str(temp_path))
-                
-                if platform.system() == 'Windows':
-                    os.startfile(str(temp_path))
-                elif platform.system() == 'Darwin':
-                    subprocess.run(['open', str(temp_path)])
-                else:
-                    subprocess.run(['xdg-open', str(temp_path)])
-                
+                self._open_in_viewer(file_data['path'])
                 logger.info(f"Opened PDF: {filename}")
-            
             except Exception as open_err:
                 self.handleError(f"Failed to open PDF: {open_err}")
         
         except Exception as e:
             self.handleError(f"Failed to view PDF: {str(e)}")
     
+    @staticmethod
+    def _source_key(file_data):
+        """Identify a base64 payload without hashing all of it
+        
+        The head and tail of a PDF (header and trailer /ID) together with
+        the name and length tell files apart.
+        """
+        base64_data = file_data['base64Data']
+        digest = hashlib.sha1()
+        digest.update(base64_data[:4096].encode('ascii', 'replace'))
+        digest.update(base64_data[-4096:].encode('ascii', 'replace'))
+        return f"{file_data.get('name', '')}:{len(base64_data)}:{digest.hexdigest()}"
+    
+    def _cached_source(self, file_data):
+        """Point a base64 entry at its decoded temp copy if one exists"""
+        if file_data.get('path') or 'base64Data' not in file_data:
+            return file_data
+        
+        with self._decoded_lock:
+            cached = self._decoded_cache.get(self._source_key(file_data))
+        if cached is None or not os.path.exists(cached):
+            return file_data
+        
+        entry = {k: v for k, v in file_data.items() if k != 'base64Data'}
+        entry['path'] = cached
+        return entry
+    
+    def _decode_once(self, file_data):
+        """Like _cached_source, but decode and write the temp copy on a miss
+        
+        The decode and write happen outside the lock, so a viewPDF on the GUI
+        thread never waits behind a running check. Each writer uses its own
+        scratch file; the first one to finish is renamed into place and any
+        other is discarded.
+        """
+        file_data = self._cached_source(file_data)
+        if file_data.get('path'):
+            return file_data
+        
+        key = self._source_key(file_data)
+        pdf_bytes = pdf_source(file_data).getvalue()
+        
+        filename = file_data.get('name', 'file.pdf')
+        safe_filename = "".join(c for c in filename if c.isalnum() or c in (' ', '.', '_', '-'))
+        key_hash = hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]
+        temp_path = self._tmpdir_path / f"decoded_{key_hash}_{safe_filename}"
+        
+        fd, part_path = tempfile.mkstemp(dir=self._tmpdir_path, prefix=f"decoded_{key_hash}_",
+                                         suffix=".part")
+        with os.fdopen(fd, 'wb') as f:
+            f.write(pdf_bytes)
+        
+        if not _IS_WINDOWS:
+            os.chmod(part_path, 0o644)
+        
+        with self._decoded_lock:
+            if key in self._decoded_cache:
+                os.remove(part_path)  # Another thread got there first
+            else:
+                os.replace(part_path, temp_path)
+                self._decoded_cache[key] = str(temp_path)
+        return self._cached_source(file_data)
+    
+    def _open_in_viewer(self, path):
+        """Open a PDF with the platform's default viewer"""
+        if _IS_WINDOWS:
+            os.startfile(path)
+        elif _IS_MAC:
+            subprocess.run(['open', path])
+        else:
+            subprocess.run(['xdg-open', path])
+    
     @Slot(int, int, str)
     def handleProgress(self, current, total, message):
         """Handle progress updates from worker"""
-        script = f"window.updateMergeProgress({current}, {total}, {json.dumps(message)});"
-        if hasattr(self.parent(), 'view'):
-            self.parent().view.page().runJavaScript(script)
+        self._pending_progress = (current, total, message)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+    
+    def flush_progress(self):
+        """Send the latest queued progress to the page"""
+        if self._pending_progress is None:
+            return
+        current, total, message = self._pending_progress
+        self._pending_progress = None
+        self.mergeProgress.emit(current, total, message)
     
     @Slot(str)
     def handleComplete(self, result_json):
         """Handle merge completion"""
         logger.info("Merge finished")
-        
-        script = f"window.handleMergeComplete({json.dumps(result_json)});"
-        if hasattr(self.parent(), 'view'):
-            self.parent().view.page().runJavaScript(script)
+        self.flush_progress()
+        self.mergeComplete.emit(result_json)
     
     @Slot(str)
     def handleError(self, error_msg):
         """Handle merge error"""
         logger.error(error_msg)
-        
-        script = f"window.handleMergeError({json.dumps(error_msg)});"
-        if hasattr(self.parent(), 'view'):
-            self.parent().view.page().runJavaScript(script)
+        self.flush_progress()
+        self.mergeError.emit(error_msg)
     
     @Slot()
     def downloadMerged(self):
@@ -368,11 +667,10 @@ class PDFBridge(QObject):
             final_name = f"{base_name}_{timestamp}.pdf"
             save_path = downloads_path / final_name
             
-            # Copy from temp to downloads
-            import shutil
-            shutil.copy2(self.last_output_path, save_path)
+            # Move from temp to downloads; the temp file is gone afterwards
+            _move_or_copy(self.last_output_path, save_path)
             
-            if sys.platform != 'win32':
+            if not _IS_WINDOWS:
                 os.chmod(save_path, 0o644)
             
             QMessageBox.information(
@@ -382,13 +680,6 @@ class PDFBridge(QObject):
             )
             
             logger.info(f"PDF saved to: {save_path}")
-            
-            # Clean up temp file after successful download
-            try:
-                os.unlink(self.last_output_path)
-                logger.info("Cleaned up temporary merge file")
-            except:
-                pass
                 
         except Exception as e:
             error_msg = f"Failed to save file: {str(e)}"
@@ -401,15 +692,14 @@ class PDFBridge(QObject):
             self.merge_worker.cancel()
             self.merge_worker.wait()
         
-        for temp_file in self.temp_view_files:
-            try:
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
-            except:
-                pass
+        try:
+            self._tmpdir.cleanup()
+        except OSError as e:
+            # e.g. a viewer still holds a decoded copy open on Windows
+            logger.warning(f"Could not remove temp dir {self._tmpdir_path}: {e}")
         
-        self.temp_files.clear()
-        self.temp_view_files.clear()
+        with self._decoded_lock:
+            self._decoded_cache.clear()
 
 
 class MainWindow(QMainWindow):
@@ -453,48 +743,10 @@ class MainWindow(QMainWindow):
             if not os.path.exists(html_path):
                 raise FileNotFoundError(f"HTML file not found: {html_path}")
             
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
-            js_file = QtCore.QFile(":/qtwebchannel/qwebchannel.js")
-            if not js_file.open(QtCore.QIODevice.ReadOnly):
-                logger.error("Failed to load qwebchannel.js")
+            html_content = _injected_html(html_path, os.stat(html_path).st_mtime_ns)
+            if html_content is None:
                 return
             
-            qwebchannel_js = js_file.readAll().data().decode('utf-8')
-            js_file.close()
-            
-            bridge_script = f"""
-            <script type="text/javascript">
-            {qwebchannel_js}
-            </script>
-            <script type="text/javascript">
-            window.bridgeReady = false;
-            window.isDesktopMode = true;
-            window.pdfBridge = null;
-            
-            document.addEventListener('DOMContentLoaded', function() {{
-                console.log('[BRIDGE] Initializing WebChannel...');
-                
-                new QWebChannel(qt.webChannelTransport, function(channel) {{
-                    window.pdfBridge = channel.objects.pdfBridge;
-                    window.bridgeReady = true;
-                    
-                    console.log('[BRIDGE] Bridge connected successfully');
-                    
-                    if (typeof window.onBridgeReady === 'function') {{
-                        window.onBridgeReady();
-                    }}
-                }});
-            }});
-            </script>
-            """
-            
-            if "</head>" in html_content:
-                html_content = html_content.replace("</head>", f"{bridge_script}</head>", 1)
-            else:
-                html_content += bridge_script
-            
             base_url = QUrl.fromLocalFile(os.path.dirname(os.path.abspath(html_path)) + "/")
             self.view.setHtml(html_content, base_url)
             
@@ -560,6 +812,10 @@ def main():
         sys.exit(1)
     
     window = MainWindow(str(html_path))
+    
+    # Pre-spawned by the launcher: imports and window are ready, wait for the click
+    if not config.wait_if_prewarmed():
+        sys.exit(0)
     window.show()
     
     logger.info("PDF Merger started successfully")
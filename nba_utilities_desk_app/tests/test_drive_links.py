@@ -0,0 +1,59 @@
+"""Drive link parsing in Glink: every supported URL form, scalar and vectorized"""
+import pytest
+
+pd = pytest.importorskip("pandas")
+Glink = pytest.importorskip("Glink")
+
+FILE_ID = "1AbCdEfGhIjKlMnOpQrStUv"
+OTHER_ID = "1ZyXwVuTsRqPoNmLkJiHgFe"
+
+LINKS = [
+    f"https://drive.google.com/open?id={FILE_ID}",
+    f"https://drive.google.com/uc?export=download&id={FILE_ID}",
+    f"https://drive.google.com/file/d/{FILE_ID}/view?usp=sharing",
+    f"https://drive.google.com/file/d/{FILE_ID}/preview",
+    f"https://drive.google.com/u/0/file/d/{FILE_ID}/view",
+    f"https://docs.google.com/document/d/{FILE_ID}/edit",
+    f"https://docs.google.com/spreadsheets/d/{FILE_ID}/edit#gid=0",
+    f"https://docs.google.com/presentation/d/{FILE_ID}/edit",
+    f"  https://drive.google.com/file/d/{FILE_ID}/view  ",
+]
+
+
+@pytest.mark.parametrize("url", LINKS)
+def test_supported_forms(url):
+    assert Glink.drive_file_id(url) == FILE_ID
+
+
+@pytest.mark.parametrize("url", [
+    # id= wins over a /d/ segment, like the original pattern ladder
+    f"https://drive.google.com/file/d/{OTHER_ID}/view?id={FILE_ID}",
+    f"https://drive.google.com/open?id={FILE_ID}&resourcekey=/d/{OTHER_ID}",
+])
+def test_query_id_takes_priority(url):
+    assert Glink.drive_file_id(url) == FILE_ID
+
+
+@pytest.mark.parametrize("url", [
+    f"https://example.com/download/{FILE_ID}",  # segment merely ending in 'd'
+    f"https://example.com/shared/{FILE_ID}",
+    "https://drive.google.com/open?id=short",
+    f"https://drive.google.com/open?id={FILE_ID}.pdf",
+    "not a link",
+    "",
+    None,
+    float("nan"),
+])
+def test_rejected(url):
+    assert Glink.drive_file_id(url) is None
+
+
+def test_vectorized_matches_scalar():
+    links = pd.Series(LINKS + [
+        f"https://drive.google.com/file/d/{OTHER_ID}/view?id={FILE_ID}",
+        f"https://example.com/shared/{FILE_ID}",
+        None,
+    ])
+    ids = Glink.drive_file_ids(links)
+    expected = [Glink.drive_file_id(url) for url in links]
+    assert [None if pd.isna(v) else v for v in ids] == expected